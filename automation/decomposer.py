@@ -1,5 +1,12 @@
 import os
-import json
+import re
+import copy
+import hashlib
+import logging
+import functools
+import importlib
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 from llm_client import LLMClient
 from utils import Utils
@@ -9,26 +16,85 @@ global_config = Utils.read_config()
 
 # ===== Decomposer agent config =====
 script_name = Utils.get_script_name(__file__)
+logger = logging.getLogger(script_name)
+logger.setLevel(logging.INFO)
 agent_config = Utils.get_agent_config(global_config, script_name)
 
 LLM_VENDOR = agent_config.get("llm_vendor", "anthropic")
 LLM_MODEL = agent_config.get("llm_model", "claude-3-haiku-20240307")
 TEMPERATURE = agent_config.get("temperature", 0)
+MAX_PARALLEL_AGENTS = agent_config.get("max_parallel_agents", 4)
 
 # Load decomposer prompt from file
 DECOMPOSER_PROMPT = Utils.read_prompt(script_name)
 
+# Extra instructions for decomposing several tasks in one call
+DECOMPOSER_BATCH_PROMPT = Utils.read_prompt(f"{script_name}_batch")
+
 # ===== Initialize LLM client =====
 # Validation happens inside LLMClient constructor
 client = LLMClient(vendor=LLM_VENDOR, model=LLM_MODEL, temperature=TEMPERATURE)
 
+# ===== Plan cache =====
+# Opt-in (DECOMPOSER_PLAN_CACHE=1): reuse plans for task descriptions that were
+# already decomposed, skipping the LLM round-trip. Persisted across processes.
+PLAN_CACHE_ENABLED = os.getenv("DECOMPOSER_PLAN_CACHE") == "1"
+PLAN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "decomposer_plans.json")
+
+
+def _load_plan_cache():
+    """Load persisted plans from disk, returning an empty cache if unavailable"""
+    try:
+        with open(PLAN_CACHE_PATH, "rb") as f:
+            return Utils.from_json(f.read())
+    except (OSError, ValueError):
+        return {}
+
 
+def _save_plan_cache():
+    """Persist the plan cache, merging entries written by concurrent runs"""
+    try:
+        os.makedirs(os.path.dirname(PLAN_CACHE_PATH), exist_ok=True)
+        merged = _load_plan_cache()
+        merged.update(_plan_cache)
+        tmp_path = f"{PLAN_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(Utils.to_json_bytes(merged))
+        os.replace(tmp_path, PLAN_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"⚠️  Could not persist plan cache: {e}")
+
+
+def _plan_cache_key(task_description):
+    """
+    Build the cache key for a task description
+
+    The model and prompt are part of the key so editing either invalidates stale plans.
+    """
+    normalized = task_description.strip().lower()
+    return hashlib.sha1(f"{LLM_MODEL}\n{DECOMPOSER_PROMPT}\n{normalized}".encode()).hexdigest()
+
+
+_plan_cache = _load_plan_cache() if PLAN_CACHE_ENABLED else {}
+
+# Resolved agent entry points, keyed by agent name
+_AGENT_FN_CACHE = {}
+
+# Plan fields consumed by the decomposer; anything else the LLM emits is dropped
+PLAN_KEYS = ("reasoning", "agents", "execution_mode", "subtasks")
+SUBTASK_KEYS = ("agent", "task", "params", "depends_on")
+
+
+@functools.lru_cache(maxsize=1)
 def get_available_agents():
     """
     Fetch available agents from config.json
 
+    The global config does not change after import, so the result is computed
+    once and shared as a read-only mapping.
+
     Returns:
-        dict: Available agents with their metadata
+        Mapping: Available agents with their metadata
     """
     available_agents = {}
 
@@ -46,10 +112,10 @@ def get_available_agents():
                 "capabilities": agent_config.get("capabilities", [])
             }
 
-    return available_agents
+    return MappingProxyType(available_agents)
 
 
-def decompose_and_execute(task_description):
+def decompose_and_execute(task_description, plan=None):
     """
     Decomposer Agent: Main function that decomposes task and executes agents
 
@@ -57,24 +123,29 @@ def decompose_and_execute(task_description):
 
     Args:
         task_description: High-level task description from master
+        plan: Pre-decomposed plan (e.g. from decompose_tasks_batch). If None, the task is decomposed with the LLM
 
     Returns:
         dict: Execution summary with results from all agents
     """
-    print(f"🧠 Decomposer Agent: Starting task decomposition")
-    print(f"   Task: '{task_description}'")
-    print(f"{'='*80}\n")
-
-    # Step 1: Use LLM to decompose the task into a plan
-    plan = decompose_task_with_llm(task_description)
+    logger.info(
+        f"🧠 Decomposer Agent: Starting task decomposition\n"
+        f"   Task: '{task_description}'\n"
+        f"{'='*80}\n"
+    )
+
+    # Step 1: Use LLM to decompose the task into a plan (unless one was supplied)
+    if plan is None:
+        plan = decompose_task_with_llm(task_description)
+    else:
+        logger.info(f"📋 Decomposer Agent: Using pre-decomposed plan")
+        log_plan(plan)
 
-    # Step 2: Execute the plan by running agents sequentially
+    # Step 2: Execute the plan (independent agents may run in parallel)
     results = execute_plan(plan)
 
     # Step 3: Return summary
-    print(f"\n{'='*80}")
-    print(f"✅ Decomposer Agent: Task completed")
-    print(f"{'='*80}")
+    logger.info(f"\n{'='*80}\n✅ Decomposer Agent: Task completed\n{'='*80}")
 
     return {
         "task": task_description,
@@ -94,14 +165,123 @@ def decompose_task_with_llm(task_description):
     Returns:
         dict: Plan with agents to execute, execution mode, and reasoning
     """
-    print(f"🤔 Decomposer Agent: Analyzing task with LLM...")
+    logger.info(f"🤔 Decomposer Agent: Analyzing task with LLM...")
+
+    # Reuse a previously decomposed plan for the same task if caching is enabled
+    cache_key = _plan_cache_key(task_description) if PLAN_CACHE_ENABLED else None
+    if cache_key is not None and cache_key in _plan_cache:
+        logger.info(f"   ♻️  Using cached plan")
+        # Copies in and out of the cache, so callers changing their plan can't corrupt it
+        plan = copy.deepcopy(_plan_cache[cache_key])
+        log_plan(plan)
+        return plan
 
-    # Get available agents from config
+    # Prepare context for LLM
+    # Static fields come first and the per-call task last, so consecutive requests
+    # share an identical prompt prefix that providers can serve from their prompt cache
+    user_message = build_context_message("task", task_description)
+
+    try:
+        # Ask LLM to decompose the task, stopping as soon as the plan JSON is complete
+        response_text = read_streamed_json(client.generate_stream(
+            system_prompt=DECOMPOSER_PROMPT,
+            user_message=user_message,
+            max_tokens=2048
+        ), "{").strip()
+
+        # Parse LLM response
+        plan = parse_llm_response(response_text)
+
+        if PLAN_CACHE_ENABLED:
+            _plan_cache[cache_key] = copy.deepcopy(plan)
+            _save_plan_cache()
+
+        log_plan(plan)
+        return plan
+
+    except Exception as e:
+        error_msg = str(e)
+
+        # Check if it's an authentication error - fail immediately
+        exit_on_auth_error(error_msg)
+
+        # For other errors, use fallback
+        logger.warning(f"⚠️  LLM decomposition failed: {error_msg}\n   Using fallback heuristic...")
+        return fallback_decompose(task_description)
+
+
+def decompose_tasks_batch(task_descriptions):
+    """
+    Decompose several tasks with a single LLM call
+
+    Cached plans are reused; the remaining tasks are sent together and the LLM
+    returns one plan per task. Tasks missing from the batch response are
+    decomposed individually.
+
+    Args:
+        task_descriptions: List of high-level task descriptions
+
+    Returns:
+        list: Plans in the same order as task_descriptions
+    """
+    logger.info(f"🤔 Decomposer Agent: Analyzing {len(task_descriptions)} task(s) with LLM...")
+
+    if PLAN_CACHE_ENABLED:
+        cache_keys = [_plan_cache_key(task) for task in task_descriptions]
+        plans = [copy.deepcopy(_plan_cache.get(key)) for key in cache_keys]
+    else:
+        cache_keys = None
+        plans = [None] * len(task_descriptions)
+    uncached = [idx for idx, plan in enumerate(plans) if plan is None]
+
+    if uncached:
+        user_message = build_context_message(
+            "tasks", [{"id": idx, "task": task_descriptions[idx]} for idx in uncached]
+        )
+
+        try:
+            response_text = read_streamed_json(client.generate_stream(
+                system_prompt=f"{DECOMPOSER_PROMPT}\n\n{DECOMPOSER_BATCH_PROMPT}",
+                user_message=user_message,
+                max_tokens=2048 * len(uncached)
+            ), "[").strip()
+
+            for entry in parse_llm_batch_response(response_text):
+                idx = entry.get("id")
+                if idx in uncached and isinstance(entry.get("plan"), dict):
+                    plans[idx] = _plan_from_document(entry["plan"])
+                    if PLAN_CACHE_ENABLED:
+                        _plan_cache[cache_keys[idx]] = copy.deepcopy(plans[idx])
+
+            if PLAN_CACHE_ENABLED:
+                _save_plan_cache()
+
+        except Exception as e:
+            error_msg = str(e)
+            exit_on_auth_error(error_msg)
+            logger.warning(f"⚠️  Batch LLM decomposition failed: {error_msg}")
+
+    for idx, task in enumerate(task_descriptions):
+        if plans[idx] is None:
+            logger.info(f"   Decomposing '{task}' individually...")
+            plans[idx] = decompose_task_with_llm(task)
+        else:
+            logger.info(f"\n   Task: '{task}'")
+            log_plan(plans[idx])
+
+    return plans
+
+
+def build_static_context():
+    """
+    Build the task-independent part of the LLM context
+
+    Returns:
+        dict: Available agents and system configuration
+    """
     available_agents = get_available_agents()
 
-    # Prepare context for LLM
-    context = {
-        "task": task_description,
+    return {
         "available_agents": {
             name: {
                 "description": info["description"],
@@ -117,112 +297,221 @@ def decompose_task_with_llm(task_description):
         }
     }
 
-    try:
-        # Ask LLM to decompose the task
-        response_text = client.generate(
-            system_prompt=DECOMPOSER_PROMPT,
-            user_message=json.dumps(context, indent=2),
-            max_tokens=2048
-        ).strip()
 
-        # Parse LLM response
-        plan = parse_llm_response(response_text)
+@functools.lru_cache(maxsize=1)
+def _static_context_prefix():
+    """Compact JSON of the static context without its closing brace, serialized once per process"""
+    return Utils.to_json(build_static_context())[:-1]
 
-        # Display the plan
-        print(f"\n📋 Task Decomposition:")
-        print(f"   Reasoning: {plan.get('reasoning', 'N/A')}")
-        print(f"   Execution Mode: {plan.get('execution_mode', 'sequential')}")
-        print(f"   Agents to execute: {', '.join(plan.get('agents', []))}")
 
-        if plan.get('subtasks'):
-            print(f"\n   Planned Subtasks:")
-            for idx, subtask in enumerate(plan['subtasks'], 1):
-                agent = subtask.get('agent', 'unknown')
-                task = subtask.get('task', 'N/A')
-                print(f"      {idx}. [{agent}] {task}")
-        print()
+def build_context_message(key, value):
+    """
+    Build the LLM user message: the static context followed by one per-call field
 
-        return plan
+    The static part is serialized once and reused, so each call only encodes
+    the per-call value. No indentation - the LLM doesn't need it.
 
-    except Exception as e:
-        error_msg = str(e)
+    Args:
+        key: Name of the per-call field (e.g. "task")
+        value: JSON-serializable value for the field
 
-        # Check if it's an authentication error - fail immediately
-        if "authentication" in error_msg.lower() or "api_key" in error_msg.lower() or "auth_token" in error_msg.lower():
-            print(f"❌ Authentication Error: {error_msg}")
-            print(f"   Please set the ANTHROPIC_API_KEY environment variable")
-            raise SystemExit(1)
+    Returns:
+        str: Compact JSON object
+    """
+    return f"{_static_context_prefix()},{Utils.to_json(key)}:{Utils.to_json(value)}}}"
 
-        # For other errors, use fallback
-        print(f"⚠️  LLM decomposition failed: {error_msg}")
-        print(f"   Using fallback heuristic...")
-        return fallback_decompose(task_description)
+
+def exit_on_auth_error(error_msg):
+    """Exit immediately if an LLM error message indicates an authentication problem"""
+    if "authentication" in error_msg.lower() or "api_key" in error_msg.lower() or "auth_token" in error_msg.lower():
+        logger.error(
+            f"❌ Authentication Error: {error_msg}\n"
+            f"   Please set the ANTHROPIC_API_KEY environment variable"
+        )
+        raise SystemExit(1)
+
+
+def log_plan(plan):
+    """Display a decomposed plan"""
+    lines = [
+        f"\n📋 Task Decomposition:",
+        f"   Reasoning: {plan.get('reasoning', 'N/A')}",
+        f"   Execution Mode: {plan.get('execution_mode', 'sequential')}",
+        f"   Agents to execute: {', '.join(plan.get('agents', []))}"
+    ]
+
+    if plan.get('subtasks'):
+        lines.append(f"\n   Planned Subtasks:")
+        for idx, subtask in enumerate(plan['subtasks'], 1):
+            agent = subtask.get('agent', 'unknown')
+            task = subtask.get('task', 'N/A')
+            lines.append(f"      {idx}. [{agent}] {task}")
+    lines.append("")
+
+    logger.info("\n".join(lines))
+
+
+def read_streamed_json(chunks, open_char):
+    """
+    Consume streamed LLM output until the first top-level JSON document closes
+
+    Anything the model emits after the JSON (closing fences, commentary) is not
+    waited for: the stream is closed as soon as the document is balanced.
+
+    Args:
+        chunks: Iterator of response text chunks (see LLMClient.generate_stream)
+        open_char: Character that starts the JSON document ("{" or "[")
+
+    Returns:
+        str: Response text up to the end of the JSON document, or the full
+             response if no complete document was found
+    """
+    parts = []
+    depth = 0
+    in_string = escaped = False
+
+    try:
+        for chunk in chunks:
+            for i, char in enumerate(chunk):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif depth == 0:
+                    # Skip any prose or fences before the document starts
+                    if char == open_char:
+                        depth = 1
+                elif char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                elif char in "}]":
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(chunk[:i + 1])
+                        return "".join(parts)
+            parts.append(chunk)
+    finally:
+        # Stop the underlying stream if we returned early
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+    return "".join(parts)
 
 
 def parse_llm_response(response_text):
     """Parse LLM response and extract JSON plan"""
-    # Extract JSON from markdown code blocks if present
-    if "```json" in response_text:
-        start = response_text.find("```json") + 7
-        end = response_text.find("```", start)
-        response_text = response_text[start:end].strip()
-    elif "```" in response_text:
-        start = response_text.find("```") + 3
-        end = response_text.find("```", start)
-        response_text = response_text[start:end].strip()
-    else:
-        # Try to find JSON object
-        json_start = -1
-        for i, char in enumerate(response_text):
-            if char == '{':
-                json_start = i
-                break
-        if json_start != -1:
-            response_text = response_text[json_start:]
+    return _plan_from_document(Utils.from_json(_extract_json_text(response_text, "{", "}")))
+
+
+def parse_llm_batch_response(response_text):
+    """Parse batch LLM response and extract the list of {"id", "plan"} entries"""
+    entries = Utils.from_json(_extract_json_text(response_text, "[", "]"))
+    return [entry for entry in entries if isinstance(entry, dict)]
+
+
+def _extract_json_text(response_text, open_char, close_char):
+    """
+    Slice the JSON document out of an LLM response
+
+    Markdown fences and surrounding prose are dropped by taking everything from
+    the first opening character to the last closing character.
+
+    Args:
+        response_text: Raw LLM response
+        open_char: Character that starts the JSON document ("{" or "[")
+        close_char: Character that ends the JSON document ("}" or "]")
 
-    return json.loads(response_text)
+    Returns:
+        str: The JSON document text (or the original text if none is found)
+    """
+    # Common case: the (stripped) response is already bare JSON - no scan or copy needed
+    if response_text[:1] == open_char and response_text[-1:] == close_char:
+        return response_text
+
+    start = response_text.find(open_char)
+    end = response_text.rfind(close_char) + 1
+    if start == -1 or end <= start:
+        return response_text
+    return response_text[start:end]
+
+
+def _plan_from_document(document):
+    """
+    Extract the plan fields the decomposer reads from a parsed LLM document
+
+    Args:
+        document: Parsed JSON object returned by the LLM
+
+    Returns:
+        dict: Plan limited to PLAN_KEYS, with subtasks limited to SUBTASK_KEYS
+    """
+    plan = {key: document[key] for key in PLAN_KEYS if key in document}
+    if "subtasks" in plan:
+        plan["subtasks"] = [
+            {key: subtask[key] for key in SUBTASK_KEYS if key in subtask}
+            for subtask in plan["subtasks"]
+        ]
+    return plan
+
+
+# Fallback keyword detection - one scan over the task for all keywords (substring match)
+_FALLBACK_KEYWORD_RE = re.compile(r"create|generate|run|execute")
+_CREATE_KEYWORDS = frozenset(("create", "generate"))
+_RUN_KEYWORDS = frozenset(("run", "execute"))
+
+# Fallback plans keyed on (has_create, has_run), built once at import (callers get copies)
+_FALLBACK_PLANS = {
+    (True, True): {
+        "reasoning": "Fallback: Detected create + execute keywords",
+        "agents": ["test_case_generator", "test_case_executor"],
+        "execution_mode": "sequential",
+        "subtasks": [
+            {"agent": "test_case_generator", "task": "Generate test cases", "depends_on": None},
+            {"agent": "test_case_executor", "task": "Execute test cases", "depends_on": ["test_case_generator"]}
+        ]
+    },
+    (False, True): {
+        "reasoning": "Fallback: Detected execute keyword",
+        "agents": ["test_case_executor"],
+        "execution_mode": "sequential",
+        "subtasks": [{"agent": "test_case_executor", "task": "Execute test cases", "depends_on": None}]
+    },
+    (True, False): {
+        "reasoning": "Fallback: Detected create keyword",
+        "agents": ["test_case_generator"],
+        "execution_mode": "sequential",
+        "subtasks": [{"agent": "test_case_generator", "task": "Generate test cases", "depends_on": None}]
+    },
+    (False, False): {
+        "reasoning": "Fallback: No matching keywords",
+        "agents": [],
+        "execution_mode": "sequential",
+        "subtasks": []
+    }
+}
 
 
 def fallback_decompose(task_description):
     """Fallback heuristic if LLM fails"""
-    task_lower = task_description.lower()
-
-    if ("create" in task_lower or "generate" in task_lower) and ("run" in task_lower or "execute" in task_lower):
-        return {
-            "reasoning": "Fallback: Detected create + execute keywords",
-            "agents": ["test_case_generator", "test_case_executor"],
-            "execution_mode": "sequential",
-            "subtasks": [
-                {"agent": "test_case_generator", "task": "Generate test cases", "depends_on": None},
-                {"agent": "test_case_executor", "task": "Execute test cases", "depends_on": ["test_case_generator"]}
-            ]
-        }
-    elif "execute" in task_lower or "run" in task_lower:
-        return {
-            "reasoning": "Fallback: Detected execute keyword",
-            "agents": ["test_case_executor"],
-            "execution_mode": "sequential",
-            "subtasks": [{"agent": "test_case_executor", "task": "Execute test cases", "depends_on": None}]
-        }
-    elif "create" in task_lower or "generate" in task_lower:
-        return {
-            "reasoning": "Fallback: Detected create keyword",
-            "agents": ["test_case_generator"],
-            "execution_mode": "sequential",
-            "subtasks": [{"agent": "test_case_generator", "task": "Generate test cases", "depends_on": None}]
-        }
-    else:
-        return {
-            "reasoning": "Fallback: No matching keywords",
-            "agents": [],
-            "execution_mode": "sequential",
-            "subtasks": []
-        }
+    keywords = set(_FALLBACK_KEYWORD_RE.findall(task_description.lower()))
+    plan = _FALLBACK_PLANS[(not keywords.isdisjoint(_CREATE_KEYWORDS), not keywords.isdisjoint(_RUN_KEYWORDS))]
+    # Deep copy so a caller changing its plan (or its agents/subtasks lists) can't alter later fallbacks
+    return copy.deepcopy(plan)
 
 
 def execute_plan(plan):
     """
-    Execute the decomposed plan by running agents in sequence
+    Execute the decomposed plan by running its agents
+
+    Agents run in plan order unless execution_mode is "parallel" (a missing mode
+    means "sequential", as in log_plan). In parallel mode the subtasks' depends_on
+    fields form a dependency graph and agents whose dependencies have completed
+    run concurrently (up to max_parallel_agents).
+    Execution stops scheduling new agents as soon as one fails.
 
     Args:
         plan: Decomposed plan with agents list
@@ -234,32 +523,90 @@ def execute_plan(plan):
     subtasks = plan.get("subtasks", [])
 
     if not agents_to_run:
-        print("⚠️  No agents to execute")
+        logger.warning("⚠️  No agents to execute")
         return []
 
-    print(f"🚀 Decomposer Agent: Executing {len(agents_to_run)} agent(s)\n")
+    logger.info(f"🚀 Decomposer Agent: Executing {len(agents_to_run)} agent(s)\n")
 
-    results = []
+    # Get corresponding subtask for each agent (first match wins)
+    subtask_by_agent = {}
+    for st in subtasks:
+        subtask_by_agent.setdefault(st.get("agent"), st)
 
-    for i, agent_name in enumerate(agents_to_run):
-        # Get corresponding subtask for this agent
-        subtask = None
-        for st in subtasks:
-            if st.get("agent") == agent_name:
-                subtask = st
-                break
+    if plan.get("execution_mode", "sequential") != "parallel":
+        return _execute_sequential(agents_to_run, subtask_by_agent)
+    return _execute_parallel(agents_to_run, subtask_by_agent)
 
-        result = execute_agent(agent_name, subtask)
+
+def _execute_sequential(agents_to_run, subtask_by_agent):
+    """Run agents one after another in plan order, stopping at the first failure"""
+    results = []
+
+    for agent_name in agents_to_run:
+        result = execute_agent(agent_name, subtask_by_agent.get(agent_name))
         results.append(result)
 
         # Stop if agent fails
         if result.get("status") == "error":
-            print(f"\n❌ Stopping execution due to {agent_name} failure")
+            logger.error(f"\n❌ Stopping execution due to {agent_name} failure")
             break
 
     return results
 
 
+def _execute_parallel(agents_to_run, subtask_by_agent):
+    """Run agents as their dependencies complete, fanning out independent ones"""
+    # Agents are tracked by plan position so repeated agent names stay distinct
+    positions = {}
+    for idx, agent_name in enumerate(agents_to_run):
+        positions.setdefault(agent_name, []).append(idx)
+
+    dependencies = {}
+    for idx, agent_name in enumerate(agents_to_run):
+        depends_on = (subtask_by_agent.get(agent_name) or {}).get("depends_on") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        # Dependencies on agents that are not part of the plan are ignored
+        dependencies[idx] = {
+            dep_idx
+            for dep_name in depends_on
+            for dep_idx in positions.get(dep_name, [])
+            if dep_idx != idx
+        }
+
+    results = [None] * len(agents_to_run)
+    pending = set(range(len(agents_to_run)))
+    completed = set()
+    running = {}
+    failed_agent = None
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_AGENTS) as executor:
+        while running or (pending and failed_agent is None):
+            if failed_agent is None:
+                ready = sorted(idx for idx in pending if dependencies[idx] <= completed)
+                if not ready and not running:
+                    # Dependency cycle: fall back to plan order
+                    ready = [min(pending)]
+                for idx in ready:
+                    pending.discard(idx)
+                    agent_name = agents_to_run[idx]
+                    future = executor.submit(execute_agent, agent_name, subtask_by_agent.get(agent_name))
+                    running[future] = idx
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                idx = running.pop(future)
+                results[idx] = future.result()
+                completed.add(idx)
+                if results[idx].get("status") == "error" and failed_agent is None:
+                    failed_agent = agents_to_run[idx]
+
+    if failed_agent is not None:
+        logger.error(f"\n❌ Stopping execution due to {failed_agent} failure")
+
+    return [result for result in results if result is not None]
+
+
 def execute_agent(agent_name, subtask=None):
     """
     Execute a specific specialized agent
@@ -285,19 +632,24 @@ def execute_agent(agent_name, subtask=None):
     module_name = agent_info["module"]
     function_name = agent_info["function"]
 
-    print(f"\n{'='*80}")
-    print(f"🤖 Decomposer Agent: Invoking {agent_name}")
-    print(f"   {agent_info['description']}")
-    print(f"{'='*80}")
+    logger.info(
+        f"\n{'='*80}\n"
+        f"🤖 Decomposer Agent: Invoking {agent_name}\n"
+        f"   {agent_info['description']}\n"
+        f"{'='*80}"
+    )
 
     try:
-        # Dynamically import and execute
-        module = __import__(module_name)
-        agent_function = getattr(module, function_name)
+        # Dynamically import the agent's entry point (resolved once per agent)
+        agent_function = _AGENT_FN_CACHE.get(agent_name)
+        if agent_function is None:
+            module = importlib.import_module(module_name)
+            agent_function = getattr(module, function_name)
+            _AGENT_FN_CACHE[agent_name] = agent_function
 
         # Extract params from subtask if provided
         if agent_name == "test_case_executor" and subtask:
-            params = subtask.get("params", {})
+            params = subtask.get("params") or {}
             test_type = params.get("test_type")
 
             # Call with test_type parameter if provided
@@ -315,7 +667,7 @@ def execute_agent(agent_name, subtask=None):
         }
 
     except Exception as e:
-        print(f"❌ Error executing {agent_name}: {str(e)}")
+        logger.error(f"❌ Error executing {agent_name}: {str(e)}")
         return {
             "agent": agent_name,
             "status": "error",
@@ -327,10 +679,12 @@ def execute_agent(agent_name, subtask=None):
 if __name__ == "__main__":
     import sys
 
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+
     if len(sys.argv) > 1:
         task = " ".join(sys.argv[1:])
     else:
         task = "create and run tests"
 
     summary = decompose_and_execute(task)
-    print(f"\n📊 Summary: {json.dumps(summary, indent=2)}")
+    logger.info(f"\n📊 Summary: {Utils.to_json(summary, indent=True)}")
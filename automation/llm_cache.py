@@ -0,0 +1,112 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+class LLMCache:
+    """
+    Persistent SQLite cache for deterministic (temperature 0) LLM validation results
+
+    Safe to share across threads: a single connection is guarded by a lock.
+    Safe to share across processes (run_all_tests.py runs several master.py at once):
+    each statement waits up to LOCK_TIMEOUT seconds for the database lock, and a lock that is
+    still held after that is treated as a cache miss (reads) or a skipped store (writes).
+    Tracks hit/miss counters for the execution summary.
+    """
+
+    # Seconds to wait for another process's lock on the database
+    LOCK_TIMEOUT = 10
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, timeout=self.LOCK_TIMEOUT, check_same_thread=False)
+        try:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS validations ("
+                "key TEXT PRIMARY KEY, passed INT, details TEXT, created_at INT)"
+            )
+            self._conn.commit()
+        except sqlite3.OperationalError:
+            # Database locked by another process; lookups below degrade to misses
+            pass
+
+    @staticmethod
+    def make_key(model: str, prompt: str, context: dict) -> str:
+        """
+        Build a cache key from everything that determines the LLM's answer
+
+        Args:
+            model: LLM model name
+            prompt: System prompt
+            context: Validation context sent as the user message
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        payload = json.dumps({"model": model, "prompt": prompt, "ctx": context}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """
+        Look up a cached validation result
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            dict: {"passed", "details"} or None on a miss
+        """
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT passed, details FROM validations WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.OperationalError:
+                # Locked by another process (or table not created yet) - treat as a miss
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return {"passed": bool(row[0]), "details": row[1]}
+
+    def set(self, key: str, passed: bool, details: str):
+        """
+        Store a validation result
+
+        Args:
+            key: Cache key from make_key()
+            passed: Whether the test passed
+            details: Validation details from the LLM
+        """
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO validations (key, passed, details, created_at) VALUES (?, ?, ?, ?)",
+                    (key, int(bool(passed)), details, int(time.time()))
+                )
+                self._conn.commit()
+            except sqlite3.OperationalError:
+                # Locked by another process - skip storing; the result is only a cache entry
+                self._conn.rollback()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters"""
+        return {"hits": self.hits, "misses": self.misses}
@@ -1,7 +1,83 @@
 import os
 import sys
-import json
-from typing import Dict, Any, List, Optional
+import time
+import threading
+from typing import Dict, Any, Iterator, List, Optional
+from utils import Utils
+
+
+# Connection pool shared by every SDK client that accepts an httpx client
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+
+
+def _make_http_client():
+    """
+    Create the pooled httpx client handed to the Anthropic/OpenAI/Azure SDKs
+
+    HTTP/2 is enabled only when the optional h2 package is installed.
+    """
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        # Generous read timeout - non-streaming completions can take minutes
+        timeout=httpx.Timeout(600.0, connect=5.0)
+    )
+
+
+def _make_anthropic():
+    from anthropic import Anthropic
+    return Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=_make_http_client())
+
+
+def _make_openai():
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=_make_http_client())
+
+
+def _make_google():
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+    return genai
+
+
+def _make_azure():
+    from openai import AzureOpenAI
+    return AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version="2024-02-01",
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        http_client=_make_http_client()
+    )
+
+
+def _make_cohere():
+    import cohere
+    return cohere.Client(api_key=os.getenv("COHERE_API_KEY"))
+
+
+# Vendor SDK factories - each imports its SDK lazily so only the vendor in use is loaded
+_VENDOR_FACTORIES = {
+    "anthropic": _make_anthropic,
+    "openai": _make_openai,
+    "google": _make_google,
+    "azure": _make_azure,
+    "cohere": _make_cohere,
+}
+
+# One SDK client per vendor, shared by all LLMClient instances so they reuse its connection pool
+_VENDOR_CLIENTS = {}
+_VENDOR_CLIENTS_LOCK = threading.Lock()
 
 
 class LLMClient:
@@ -11,16 +87,9 @@ class LLMClient:
     Handles API key validation, vendor-specific API calls, and response normalization.
     """
 
-    # Load supported vendors from JSON config
+    # Load supported vendors from JSON config (once, at import)
     _VENDORS_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "llm_vendors.json")
-    SUPPORTED_VENDORS = {}
-
-    @classmethod
-    def _load_vendors_config(cls):
-        """Load vendor configurations from JSON file"""
-        if not cls.SUPPORTED_VENDORS:
-            with open(cls._VENDORS_CONFIG_PATH, 'r') as f:
-                cls.SUPPORTED_VENDORS = json.load(f)
+    SUPPORTED_VENDORS = Utils.read_config(_VENDORS_CONFIG_PATH)
 
     def __init__(self, vendor: str, model: str, temperature: float = 0):
         """
@@ -35,9 +104,6 @@ class LLMClient:
             ValueError: If vendor is not supported
             SystemExit: If API key is not set for the vendor
         """
-        # Load vendors config if not already loaded
-        self._load_vendors_config()
-
         self.vendor = vendor.lower()
         self.model = model
         self.temperature = temperature
@@ -56,6 +122,15 @@ class LLMClient:
         self._client = None
         self._init_client()
 
+        # Resolve the vendor-specific generator once instead of branching on every call
+        self._generate = {
+            "anthropic": self._generate_anthropic,
+            "openai": self._generate_openai,
+            "google": self._generate_google,
+            "azure": self._generate_azure,
+            "cohere": self._generate_cohere,
+        }[self.vendor]
+
     def _validate_api_key(self):
         """
         Validate that required API key(s) are set for the vendor
@@ -102,37 +177,18 @@ class LLMClient:
                 sys.exit(1)
 
     def _init_client(self):
-        """Initialize vendor-specific API client"""
-        if self.vendor == "anthropic":
-            from anthropic import Anthropic
-            self._client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-
-        elif self.vendor == "openai":
-            from openai import OpenAI
-            self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-        elif self.vendor == "google":
-            import google.generativeai as genai
-            genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-            self._client = genai
-
-        elif self.vendor == "azure":
-            from openai import AzureOpenAI
-            self._client = AzureOpenAI(
-                api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-                api_version="2024-02-01",
-                azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
-            )
-
-        elif self.vendor == "cohere":
-            import cohere
-            self._client = cohere.Client(api_key=os.getenv("COHERE_API_KEY"))
+        """Initialize vendor-specific API client (shared per vendor)"""
+        with _VENDOR_CLIENTS_LOCK:
+            if self.vendor not in _VENDOR_CLIENTS:
+                _VENDOR_CLIENTS[self.vendor] = _VENDOR_FACTORIES[self.vendor]()
+            self._client = _VENDOR_CLIENTS[self.vendor]
 
     def generate(
         self,
         system_prompt: str,
         user_message: str,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache_user_message: bool = False
     ) -> str:
         """
         Generate response from LLM
@@ -141,35 +197,180 @@ class LLMClient:
             system_prompt: System instruction/prompt
             user_message: User message/query
             max_tokens: Maximum tokens in response
+            cache_user_message: Also mark the user message for prompt caching, for large
+                inputs that are resent unchanged (e.g. an OpenAPI schema). Anthropic only.
 
         Returns:
             str: Generated response text
 
+        Raises:
+            Exception: If API call fails
+        """
+        if cache_user_message and self.vendor == "anthropic":
+            return self._generate_anthropic(system_prompt, user_message, max_tokens, cache_user_message=True)
+        return self._generate(system_prompt, user_message, max_tokens)
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int = 4096
+    ) -> Iterator[str]:
+        """
+        Generate response from LLM as a stream of text chunks
+
+        Callers may stop iterating early (e.g. once the JSON they need is complete);
+        closing the generator closes the underlying stream. Vendors without a
+        streaming implementation yield the full response as a single chunk.
+
+        Args:
+            system_prompt: System instruction/prompt
+            user_message: User message/query
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            str: Response text chunks
+
         Raises:
             Exception: If API call fails
         """
         if self.vendor == "anthropic":
-            return self._generate_anthropic(system_prompt, user_message, max_tokens)
-        elif self.vendor == "openai":
-            return self._generate_openai(system_prompt, user_message, max_tokens)
-        elif self.vendor == "google":
-            return self._generate_google(system_prompt, user_message, max_tokens)
-        elif self.vendor == "azure":
-            return self._generate_azure(system_prompt, user_message, max_tokens)
-        elif self.vendor == "cohere":
-            return self._generate_cohere(system_prompt, user_message, max_tokens)
-
-    def _generate_anthropic(self, system_prompt: str, user_message: str, max_tokens: int) -> str:
+            yield from self._stream_anthropic(system_prompt, user_message, max_tokens)
+        else:
+            yield self._generate(system_prompt, user_message, max_tokens)
+
+    def generate_batch(
+        self,
+        system_prompt: str,
+        user_messages: Dict[str, str],
+        max_tokens: int = 4096,
+        shared_prefix: Optional[str] = None,
+        poll_interval: float = 10.0,
+        timeout: Optional[float] = 3600.0
+    ) -> Dict[str, str]:
+        """
+        Generate responses for several prompts as one offline batch job
+
+        Anthropic runs the requests through the Message Batches API (billed at a discount,
+        finished asynchronously) and this call polls until the batch has ended. Requests that
+        don't succeed in the batch are retried synchronously. A batch still running after
+        timeout seconds is canceled and every request is generated synchronously instead.
+        Other vendors generate each request in turn.
+
+        Args:
+            system_prompt: System instruction/prompt shared by every request
+            user_messages: Mapping of request id -> user message
+            max_tokens: Maximum tokens in each response
+            shared_prefix: Large input prepended to every user message (e.g. an OpenAPI
+                schema), marked for prompt caching so it is processed once
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch to end before canceling it (None: no limit)
+
+        Returns:
+            Dict[str, str]: Mapping of request id -> generated response text
+
+        Raises:
+            Exception: If API call fails
+        """
+        if self.vendor != "anthropic":
+            return {
+                custom_id: self._generate(system_prompt, self._join_prefix(shared_prefix, message), max_tokens)
+                for custom_id, message in user_messages.items()
+            }
+
+        def content(message):
+            blocks = []
+            if shared_prefix is not None:
+                blocks.append({"type": "text", "text": shared_prefix, "cache_control": {"type": "ephemeral"}})
+            blocks.append({"type": "text", "text": message})
+            return blocks
+
+        batch = self._client.messages.batches.create(requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": max_tokens,
+                    "system": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+                    "messages": [{"role": "user", "content": content(message)}],
+                    "temperature": self.temperature
+                }
+            }
+            for custom_id, message in user_messages.items()
+        ])
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            delay = poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            batch = self._client.messages.batches.retrieve(batch.id)
+
+        responses = {}
+        if batch.processing_status == "ended":
+            for entry in self._client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    responses[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            print(f"⚠️  Batch {batch.id} did not finish within {timeout:g}s - canceling and generating synchronously")
+            try:
+                self._client.messages.batches.cancel(batch.id)
+            except Exception:
+                # Best effort; the batch expires on its own otherwise
+                pass
+
+        # Errored/expired/canceled (or timed out) requests fall back to a regular call
+        for custom_id, message in user_messages.items():
+            if custom_id not in responses:
+                responses[custom_id] = self._generate(
+                    system_prompt, self._join_prefix(shared_prefix, message), max_tokens
+                )
+        return responses
+
+    @staticmethod
+    def _join_prefix(shared_prefix: Optional[str], message: str) -> str:
+        """Prepend a batch's shared prefix to a user message"""
+        if shared_prefix is None:
+            return message
+        return f"{shared_prefix}\n\n{message}"
+
+    def _generate_anthropic(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        cache_user_message: bool = False
+    ) -> str:
         """Generate response using Anthropic Claude API"""
+        content = user_message
+        if cache_user_message:
+            content = [{"type": "text", "text": user_message, "cache_control": {"type": "ephemeral"}}]
+
+        # Mark the system prompt as cacheable so repeated calls skip re-processing it
         response = self._client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_message}],
+            system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": content}],
             temperature=self.temperature
         )
         return response.content[0].text
 
+    def _stream_anthropic(self, system_prompt: str, user_message: str, max_tokens: int) -> Iterator[str]:
+        """Stream response text using Anthropic Claude API"""
+        with self._client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": user_message}],
+            temperature=self.temperature
+        ) as stream:
+            yield from stream.text_stream
+
     def _generate_openai(self, system_prompt: str, user_message: str, max_tokens: int) -> str:
         """Generate response using OpenAI API"""
         response = self._client.chat.completions.create(
@@ -231,13 +432,11 @@ class LLMClient:
     @classmethod
     def get_supported_vendors(cls) -> List[str]:
         """Get list of supported LLM vendors"""
-        cls._load_vendors_config()
         return list(cls.SUPPORTED_VENDORS.keys())
 
     @classmethod
     def get_vendor_models(cls, vendor: str) -> List[str]:
         """Get list of models for a specific vendor"""
-        cls._load_vendors_config()
         vendor = vendor.lower()
         if vendor in cls.SUPPORTED_VENDORS:
             return cls.SUPPORTED_VENDORS[vendor]["models"]
@@ -255,7 +454,6 @@ class LLMClient:
         Returns:
             bool: True if valid, False otherwise
         """
-        cls._load_vendors_config()
         vendor = vendor.lower()
         if vendor not in cls.SUPPORTED_VENDORS:
             return False
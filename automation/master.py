@@ -1,5 +1,6 @@
 import os
-import json
+import sys
+import logging
 import argparse
 from datetime import datetime
 from utils import Utils
@@ -13,6 +14,8 @@ global_config = Utils.read_config()
 
 # ===== Master agent config =====
 script_name = Utils.get_script_name(__file__)
+logger = logging.getLogger(script_name)
+logger.setLevel(logging.INFO)
 
 
 def main():
@@ -49,47 +52,64 @@ Examples:
         help="Task description (e.g., 'execute testcases', 'create and run tests')"
     )
 
+    parser.add_argument(
+        "--plan",
+        type=str,
+        default=None,
+        help="Pre-decomposed plan as JSON; skips the decomposer LLM call (used by run_all_tests.py)"
+    )
+
     args = parser.parse_args()
 
-    print("\n" + "="*80)
-    print("🎯 MASTER AGENT - API Test Automation Framework")
-    print("="*80)
-    print(f"📋 Task: {args.task}")
-    print(f"⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("="*80 + "\n")
+    # Single stdout handler shared by master and the decomposer's logger
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    plan = Utils.from_json(args.plan) if args.plan else None
 
-    # Delegate to Decomposer agent
-    print("📤 Master Agent: Delegating to Decomposer Agent...")
-    print()
+    logger.info("\n".join([
+        "\n" + "="*80,
+        "🎯 MASTER AGENT - API Test Automation Framework",
+        "="*80,
+        f"📋 Task: {args.task}",
+        f"⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "="*80 + "\n",
+        "📤 Master Agent: Delegating to Decomposer Agent...\n"
+    ]))
 
     from decomposer import decompose_and_execute
 
     # Execute task via decomposer
-    summary = decompose_and_execute(args.task)
+    summary = decompose_and_execute(args.task, plan=plan)
 
     # Save execution summary
-    summary_file = f"master_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    # Take the completion time once; it names the summary file and is printed below.
+    # Microseconds and the PID keep concurrent runs (run_all_tests.py) from overwriting each other
+    completed_at = datetime.now()
+    summary_file = f"master_execution_{completed_at.strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}.json"
+    with open(summary_file, 'wb') as f:
+        f.write(Utils.to_json_bytes(summary, indent=True))
 
     # Final summary
-    print("\n" + "="*80)
-    print("✅ MASTER AGENT - Execution Complete")
-    print("="*80)
-    print(f"📊 Task: {args.task}")
-    print(f"⏰ Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = [
+        "\n" + "="*80,
+        "✅ MASTER AGENT - Execution Complete",
+        "="*80,
+        f"📊 Task: {args.task}",
+        f"⏰ Completed: {completed_at.strftime('%Y-%m-%d %H:%M:%S')}"
+    ]
 
     results = summary.get("results", [])
     if results:
-        print(f"\n   Agents executed: {len(results)}")
+        lines.append(f"\n   Agents executed: {len(results)}")
         for result in results:
             agent_name = result.get("agent", "unknown")
             status = result.get("status", "unknown")
             symbol = "✅" if status == "completed" else "❌"
-            print(f"   {symbol} {agent_name}: {status}")
+            lines.append(f"   {symbol} {agent_name}: {status}")
+
+    lines.append(f"\n💾 Execution summary saved to: {summary_file}")
+    lines.append("="*80 + "\n")
 
-    print(f"\n💾 Execution summary saved to: {summary_file}")
-    print("="*80 + "\n")
+    logger.info("\n".join(lines))
 
     return 0
 
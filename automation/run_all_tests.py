@@ -1,28 +1,85 @@
 #!/usr/bin/env python3
+import argparse
+import logging
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils import Utils
 
 test_types = ['system', 'component', 'regression', 'sanity']
 
-print("=" * 80)
-print("🚀 Running tests for all test types")
-print("=" * 80)
 
-for test_type in test_types:
-    print(f"\n{'=' * 80}")
-    print(f"📊 Running {test_type.upper()} tests...")
-    print("=" * 80)
-    
-    result = subprocess.run(
-        ['python', 'master.py', '--task', f'execute {test_type} tests'],
-        capture_output=False
+def run_test_type(task, plan):
+    """
+    Run master.py for a single test type with a pre-decomposed plan
+
+    Output is captured so concurrent runs don't interleave on the console.
+
+    Args:
+        task: Task description for the test type
+        plan: Plan returned by the decomposer for this task
+
+    Returns:
+        CompletedProcess with captured stdout/stderr
+    """
+    return subprocess.run(
+        [sys.executable, 'master.py', '--task', task, '--plan', Utils.to_json(plan)],
+        capture_output=True,
+        text=True
     )
-    
-    if result.returncode == 0:
-        print(f"✅ {test_type.upper()} tests completed")
-    else:
-        print(f"❌ {test_type.upper()} tests failed")
-
-print("\n" + "=" * 80)
-print("✅ All test types executed!")
-print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run tests for all test types")
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=len(test_types),
+        help=f"Maximum number of test types to run concurrently (default: {len(test_types)})"
+    )
+    args = parser.parse_args()
+
+    # Route the decomposer's batch output to stdout alongside this script's prints
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+
+    print("=" * 80)
+    print("🚀 Running tests for all test types")
+    print("=" * 80)
+
+    # Decompose all tasks with a single LLM call; each master.py run then skips decomposition
+    Utils.validate_llm_auth()
+    from decomposer import decompose_tasks_batch
+
+    tasks = [f'execute {test_type} tests' for test_type in test_types]
+    plans = decompose_tasks_batch(tasks)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.max_parallel)) as executor:
+        futures = {
+            executor.submit(run_test_type, task, plan): test_type
+            for test_type, task, plan in zip(test_types, tasks, plans)
+        }
+
+        # Print each test type's buffered output as soon as it finishes
+        for future in as_completed(futures):
+            test_type = futures[future]
+            result = future.result()
+
+            print(f"\n{'=' * 80}")
+            print(f"📊 {test_type.upper()} tests output")
+            print("=" * 80)
+            print(result.stdout, end="")
+            if result.stderr:
+                print(result.stderr, end="", file=sys.stderr)
+
+            if result.returncode == 0:
+                print(f"✅ {test_type.upper()} tests completed")
+            else:
+                print(f"❌ {test_type.upper()} tests failed")
+
+    print("\n" + "=" * 80)
+    print("✅ All test types executed!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
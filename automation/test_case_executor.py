@@ -1,8 +1,19 @@
 import os
+import re
+import sys
 import json
+import queue
+import hashlib
+import logging
+import functools
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from anthropic import Anthropic
 from utils import Utils
+from llm_cache import LLMCache
 
 # ===== Validate authentication early =====
 Utils.validate_anthropic_auth()
@@ -18,32 +29,100 @@ AUTH_TYPE = global_config["api"].get("auth_type", None)
 script_name = Utils.get_script_name(__file__)
 agent_config = Utils.get_agent_config(global_config, script_name)
 
+# Progress output goes through a queue and is written to stdout by a single listener thread,
+# so callers never block on console I/O. EXECUTOR_LOG_LEVEL=WARNING silences per-test output.
+logger = logging.getLogger(script_name)
+logger.setLevel(os.getenv("EXECUTOR_LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _console_handler)
+# Number of execute_tests() calls in progress; the listener runs while any is active
+_log_users = 0
+_log_users_lock = threading.Lock()
+
 TESTCASES_DIR = global_config["agents"]["test_case_generator"].get("output_dir", "testcases")
 LLM_MODEL = agent_config.get("llm_model", "claude-3-haiku-20240307")
 TEMPERATURE = agent_config.get("temperature", 0)
+PARALLELISM = agent_config.get("parallelism", 16)
+CACHE_ENABLED = agent_config.get("cache_enabled", True)
+LLM_CONCURRENCY = agent_config.get("llm_concurrency", 8)
+# "always": every result goes to the LLM; "fallback": clear-cut results are decided locally
+# and only the rest go to the LLM; "never": status code check only
+LLM_VALIDATION = agent_config.get("llm_validation", "fallback")
+# Test cases validated per batched LLM call; keeps max_tokens (1024 per test) within the model's output limit
+LLM_BATCH_SIZE = max(1, agent_config.get("llm_batch_size", 8))
 
 # Load executor prompt from file
 EXECUTOR_PROMPT = Utils.read_prompt(script_name)
 
+# Extra instructions for validating several test cases in one call
+EXECUTOR_BATCH_PROMPT = Utils.read_prompt(f"{script_name}_batch")
+
+# {name} placeholders in endpoint paths
+_PATH_PARAM_RE = re.compile(r"\{([^{}/]+)\}")
+
 # ===== Initialize Anthropic client =====
 client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
+# Caps in-flight LLM calls independently of HTTP parallelism, to stay within API rate limits
+_llm_slots = threading.BoundedSemaphore(max(1, LLM_CONCURRENCY))
 
-def validate_with_llm(test_case, actual_status, response_body, expected_status):
+# ===== LLM validation cache (only deterministic, temperature 0, results are cached) =====
+llm_cache = LLMCache(os.path.join(TESTCASES_DIR, ".llm_cache.sqlite")) if CACHE_ENABLED and TEMPERATURE == 0 else None
+
+# In-process LRU memo of validation results, so identical contexts within a run hit the LLM once
+MEMO_ENABLED = TEMPERATURE == 0
+MEMO_MAX_ENTRIES = 4096
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _create_message(**kwargs):
+    """Call client.messages.create, waiting for a free LLM slot first"""
+    with _llm_slots:
+        return client.messages.create(**kwargs)
+
+
+def _fast_validate(test_case, actual_status, expected_status):
     """
-    Use LLM to intelligently validate test results
+    Decide clear-cut test results without the LLM
+
+    A status code mismatch always fails (the LLM is told to fail those too). A
+    matching status passes outright for tests marked "validation": "status_only",
+    or for every test when llm_validation is "never".
 
     Args:
         test_case: The test case definition
         actual_status: The actual HTTP status code received
-        response_body: The actual response body
         expected_status: The expected HTTP status code
 
     Returns:
-        dict: Validation result with 'passed' (bool) and 'details' (str)
+        dict: Validation result with 'passed' and 'details', or None if the LLM must decide
     """
-    # Prepare context for LLM validation
-    validation_context = {
+    if LLM_VALIDATION == "always":
+        return None
+
+    if actual_status != expected_status:
+        return {
+            "passed": False,
+            "details": f"Expected status {expected_status} but got {actual_status}."
+        }
+
+    if LLM_VALIDATION == "never" or test_case.get("validation") == "status_only":
+        return {
+            "passed": True,
+            "details": f"Status {actual_status} matches expected {expected_status} (status-only validation)."
+        }
+
+    return None
+
+
+def _validation_context(test_case, actual_status, response_body, expected_status):
+    """Build the context the LLM validates a single test case against"""
+    return {
         "test_name": test_case.get("name", ""),
         "test_description": test_case.get("description", ""),
         "request_body": test_case.get("requestBody", {}),
@@ -52,14 +131,105 @@ def validate_with_llm(test_case, actual_status, response_body, expected_status):
         "actual_response_body": response_body,
     }
 
+
+def validate_with_llm(test_case, actual_status, response_body, expected_status):
+    """
+    Use LLM to intelligently validate test results
+
+    Args:
+        test_case: The test case definition
+        actual_status: The actual HTTP status code received
+        response_body: The actual response body
+        expected_status: The expected HTTP status code
+
+    Returns:
+        dict: Validation result with 'passed' (bool) and 'details' (str)
+    """
+    fast_result = _fast_validate(test_case, actual_status, expected_status)
+    if fast_result is not None:
+        return fast_result
+
+    # Prepare context for LLM validation
+    validation_context = _validation_context(test_case, actual_status, response_body, expected_status)
+
+    cached, memo_key, cache_key = _cached_validation(validation_context)
+    if cached is not None:
+        return cached
+
+    return _validate_context_with_llm(validation_context, memo_key, cache_key)
+
+
+def _memo_key(validation_context):
+    """Hash of a validation context for the in-process memo (key order independent)"""
+    return hashlib.blake2b(Utils.to_json_bytes(validation_context, sort_keys=True), digest_size=16).digest()
+
+
+def _cached_validation(validation_context):
+    """
+    Look up a validation result in the in-process memo, then in the persistent cache
+
+    Args:
+        validation_context: Context built by _validation_context()
+
+    Returns:
+        tuple: (result or None, memo key or None, persistent cache key or None)
+    """
+    memo_key = _memo_key(validation_context) if MEMO_ENABLED else None
+    if memo_key is not None:
+        with _memo_lock:
+            result = _memo.get(memo_key)
+            if result is not None:
+                _memo.move_to_end(memo_key)
+                return result, memo_key, None
+
+    cache_key = None
+    if llm_cache is not None:
+        cache_key = LLMCache.make_key(LLM_MODEL, EXECUTOR_PROMPT, validation_context)
+        result = llm_cache.get(cache_key)
+        if result is not None:
+            _store_validation(result, memo_key, None)
+            return result, memo_key, cache_key
+
+    return None, memo_key, cache_key
+
+
+def _store_validation(result, memo_key, cache_key):
+    """Remember an LLM validation result in the in-process memo and the persistent cache"""
+    if memo_key is not None:
+        with _memo_lock:
+            _memo[memo_key] = result
+            _memo.move_to_end(memo_key)
+            if len(_memo) > MEMO_MAX_ENTRIES:
+                _memo.popitem(last=False)
+
+    if cache_key is not None and isinstance(result["details"], str):
+        llm_cache.set(cache_key, result["passed"], result["details"])
+
+
+def _validate_context_with_llm(validation_context, memo_key=None, cache_key=None):
+    """
+    Ask the LLM to validate one test result (no cache lookup)
+
+    Args:
+        validation_context: Context built by _validation_context()
+        memo_key: In-process memo key to store a successful result under, or None
+        cache_key: Persistent cache key to store a successful result under, or None
+
+    Returns:
+        dict: Validation result with 'passed' (bool) and 'details' (str)
+    """
+    actual_status = validation_context["actual_status_code"]
+    expected_status = validation_context["expected_status_code"]
+
     # Ask LLM to validate intelligently
     try:
-        resp = client.messages.create(
+        resp = _create_message(
             model=LLM_MODEL,
             max_tokens=1024,
-            system=EXECUTOR_PROMPT,
+            # Cacheable system prompt: identical for every test case in the run
+            system=[{"type": "text", "text": EXECUTOR_PROMPT, "cache_control": {"type": "ephemeral"}}],
             messages=[
-                {"role": "user", "content": json.dumps(validation_context, indent=2)}
+                {"role": "user", "content": Utils.to_json(validation_context, indent=True)}
             ],
             temperature=TEMPERATURE
         )
@@ -69,30 +239,13 @@ def validate_with_llm(test_case, actual_status, response_body, expected_status):
         # Parse LLM response
         # Expected format: {"passed": true/false, "details": "explanation"}
         try:
-            # Extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
-            else:
-                # Try to find JSON object in the response
-                json_start = -1
-                for i, char in enumerate(response_text):
-                    if char == '{':
-                        json_start = i
-                        break
-                if json_start != -1:
-                    response_text = response_text[json_start:]
-
-            validation_result = json.loads(response_text)
-            return {
+            validation_result = Utils.extract_json(response_text, "{")
+            result = {
                 "passed": validation_result.get("passed", False),
                 "details": validation_result.get("details", "")
             }
+            _store_validation(result, memo_key, cache_key)
+            return result
         except json.JSONDecodeError:
             # Fallback: analyze the text response
             passed = actual_status == expected_status and ("pass" in response_text.lower() or "success" in response_text.lower())
@@ -110,6 +263,315 @@ def validate_with_llm(test_case, actual_status, response_body, expected_status):
         }
 
 
+def validate_batch_with_llm(items):
+    """
+    Validate several test results with a single LLM call
+
+    Clear-cut results (see _fast_validate) and cached results are reused, and
+    identical contexts are sent only once. The remaining test cases are sent in
+    batches of up to llm_batch_size and the LLM returns one verdict per test case,
+    in order. Test cases a batch call doesn't answer are validated individually.
+
+    Args:
+        items: List of dicts with 'test_case', 'actual_status', 'response_body' and 'expected_status'
+
+    Returns:
+        list: Validation results ('passed', 'details') in the same order as items
+    """
+    contexts = [
+        _validation_context(item["test_case"], item["actual_status"], item["response_body"], item["expected_status"])
+        for item in items
+    ]
+
+    results = [
+        _fast_validate(item["test_case"], item["actual_status"], item["expected_status"])
+        for item in items
+    ]
+    memo_keys = [None] * len(items)
+    cache_keys = [None] * len(items)
+
+    # Unanswered contexts, deduplicated by memo key: first index -> indexes sharing its context
+    pending = {}
+    first_index = {}
+    for idx, context in enumerate(contexts):
+        if results[idx] is not None:
+            continue
+        results[idx], memo_keys[idx], cache_keys[idx] = _cached_validation(context)
+        if results[idx] is not None:
+            continue
+        first = first_index.setdefault(memo_keys[idx], idx) if memo_keys[idx] is not None else idx
+        pending.setdefault(first, []).append(idx)
+
+    uncached = list(pending)
+
+    for start in range(0, len(uncached), LLM_BATCH_SIZE):
+        batch = uncached[start:start + LLM_BATCH_SIZE]
+        if len(batch) < 2:
+            # A single test case is validated individually below
+            continue
+        try:
+            resp = _create_message(
+                model=LLM_MODEL,
+                max_tokens=1024 * len(batch),
+                system=[{"type": "text", "text": f"{EXECUTOR_PROMPT}\n\n{EXECUTOR_BATCH_PROMPT}", "cache_control": {"type": "ephemeral"}}],
+                messages=[
+                    {"role": "user", "content": Utils.to_json({"batch": [contexts[idx] for idx in batch]})}
+                ],
+                temperature=TEMPERATURE
+            )
+
+            verdicts = Utils.extract_json(resp.content[0].text.strip(), "[")
+            if isinstance(verdicts, list) and len(verdicts) == len(batch):
+                for idx, verdict in zip(batch, verdicts):
+                    if not isinstance(verdict, dict):
+                        continue
+                    results[idx] = {
+                        "passed": verdict.get("passed", False),
+                        "details": verdict.get("details", "")
+                    }
+                    _store_validation(results[idx], memo_keys[idx], cache_keys[idx])
+        except Exception:
+            # Fall through to per-test validation below
+            pass
+
+    for idx, duplicates in pending.items():
+        if results[idx] is None:
+            results[idx] = _validate_context_with_llm(contexts[idx], memo_keys[idx], cache_keys[idx])
+        for dup in duplicates:
+            results[dup] = results[idx]
+
+    return results
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_test_file(file_path, mtime_ns):
+    """
+    Load and parse a test case file, memoized on (path, mtime)
+
+    The mtime is part of the key so edited files are re-read. The returned dict is
+    shared between calls and must not be mutated.
+
+    Args:
+        file_path: Path to the test case JSON file
+        mtime_ns: File modification time in nanoseconds (from os.stat)
+
+    Returns:
+        dict: Parsed test case file
+    """
+    with open(file_path, 'rb') as f:
+        return Utils.from_json(f.read())
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_param_names(endpoint):
+    """Names of the {param} placeholders in an endpoint path (computed once per endpoint)"""
+    return frozenset(_PATH_PARAM_RE.findall(endpoint))
+
+
+def _send_request(endpoint, method, test_case, send):
+    """
+    Execute the API request for a single test case
+
+    Args:
+        endpoint: Endpoint path (may contain {param} placeholders)
+        method: HTTP method
+        test_case: The test case definition
+        send: Sender bound to the base URL and authentication (see _bind_sender)
+
+    Returns:
+        tuple: (actual status code, response body)
+    """
+    request_body = test_case.get("requestBody", {})
+    params = test_case.get("params", None)
+
+    # Separate path parameters from query parameters
+    path_names = _path_param_names(endpoint)
+    path_params = {}
+    query_params = {}
+
+    if params:
+        for param_name, param_value in params.items():
+            if param_name in path_names:
+                path_params[param_name] = param_value
+            else:
+                query_params[param_name] = param_value
+
+    # Substitute all path parameters in one pass; placeholders without a value are kept
+    actual_endpoint = endpoint
+    if path_params:
+        actual_endpoint = _PATH_PARAM_RE.sub(
+            lambda m: str(path_params[m.group(1)]) if m.group(1) in path_params else m.group(0),
+            endpoint
+        )
+
+    response = send(
+        method,
+        actual_endpoint,
+        request_body=request_body if request_body else None,
+        params=query_params if query_params else None
+    )
+
+    # Try to parse response body as JSON
+    try:
+        response_body = response.json()
+    except:
+        response_body = response.text
+
+    return response.status_code, response_body
+
+
+def _new_result(test_file, endpoint, method, test_case, idx):
+    """
+    Build the report entry and console lines for a test case before it is validated
+
+    Args:
+        test_file: Name of the test case file
+        endpoint: Endpoint path as written in the test file
+        method: HTTP method
+        test_case: The test case definition
+        idx: 1-based position of the test case in its file
+
+    Returns:
+        tuple: (test_result dict, list of output lines)
+    """
+    test_name = test_case.get("name", f"Test {idx}")
+    description = test_case.get("description", "")
+
+    output = [
+        f"\n   🧪 Test {idx}: {test_name}",
+        f"      Description: {description}"
+    ]
+
+    test_result = {
+        "file": test_file,
+        "test_name": test_name,
+        "description": description,
+        "endpoint": endpoint,
+        "method": method,
+        "expected_status": test_case.get("expectedStatusCode", 200),
+        "actual_status": None,
+        "passed": False,
+        "details": None,
+        "response_body": None
+    }
+
+    return test_result, output
+
+
+def _error_results(test_file, endpoint, method, test_cases, error):
+    """
+    Record every test case of a file as errored (used when processing the file failed)
+
+    Args:
+        test_file: Name of the test case file
+        endpoint: Endpoint path as written in the test file
+        method: HTTP method
+        test_cases: The file's test case definitions
+        error: Exception raised while processing the file
+
+    Returns:
+        list: (test_result dict, output text) per test case, in file order
+    """
+    results = []
+    for idx, test_case in enumerate(test_cases, 1):
+        test_result, output = _new_result(test_file, endpoint, method, test_case, idx)
+        output.append(f"      ❌ Unexpected error: {str(error)}")
+        test_result["details"] = f"Error: {str(error)}"
+        results.append((test_result, "\n".join(output)))
+    return results
+
+
+def _bind_sender(base_url, auth_type):
+    """
+    Bind the base URL and authentication once for every request of a run (see Utils.bind)
+
+    Args:
+        base_url: Base URL for the API endpoints
+        auth_type: Authentication type ('basic', 'bearer', 'token', or None)
+
+    Returns:
+        callable: send(method, endpoint, request_body=None, params=None) -> Response
+    """
+    try:
+        return Utils.bind(base_url, auth_type)
+    except ValueError as e:
+        # Missing credentials: fail each request with the error, as execute_request would,
+        # so every test is reported as errored
+        auth_error = e
+
+        def send(method, endpoint, request_body=None, params=None):
+            raise auth_error
+
+        return send
+
+
+def _run_file(test_file, endpoint, method, test_cases, request_futures):
+    """
+    Validate a file's test cases with one batched LLM call and build their results
+
+    Runs on a worker thread, so console output is returned rather than printed.
+
+    Args:
+        test_file: Name of the test case file
+        endpoint: Endpoint path as written in the test file
+        method: HTTP method
+        test_cases: The file's test case definitions
+        request_futures: One future per test case resolving to (status, response body)
+
+    Returns:
+        list: (test_result dict, output text) per test case, in file order
+    """
+    outcomes = []
+    for future in request_futures:
+        try:
+            outcomes.append((future.result(), None))
+        except Exception as e:
+            outcomes.append((None, e))
+
+    # Validate all successful requests of this file together
+    items = [
+        {
+            "test_case": test_case,
+            "actual_status": response[0],
+            "response_body": response[1],
+            "expected_status": test_case.get("expectedStatusCode", 200)
+        }
+        for test_case, (response, error) in zip(test_cases, outcomes)
+        if error is None
+    ]
+    validations = iter(validate_batch_with_llm(items))
+
+    results = []
+    for idx, (test_case, (response, error)) in enumerate(zip(test_cases, outcomes), 1):
+        test_result, output = _new_result(test_file, endpoint, method, test_case, idx)
+        expected_status = test_result["expected_status"]
+
+        if error is None:
+            actual_status, response_body = response
+            validation_result = next(validations)
+            test_result.update({
+                "actual_status": actual_status,
+                "passed": validation_result["passed"],
+                "details": validation_result["details"],
+                "response_body": response_body
+            })
+
+            output.append(f"      ✅ PASSED" if validation_result["passed"] else f"      ❌ FAILED")
+            output.append(f"      Expected: {expected_status}, Got: {actual_status}")
+            if validation_result["details"]:
+                output.append(f"      Details: {validation_result['details']}")
+        elif isinstance(error, ValueError):
+            output.append(f"      ❌ Error: {str(error)}")
+            test_result["details"] = str(error)
+        else:
+            output.append(f"      ❌ Unexpected error: {str(error)}")
+            test_result["details"] = f"Error: {str(error)}"
+
+        results.append((test_result, "\n".join(output)))
+
+    return results
+
+
 def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH_TYPE, test_type=None):
     """
     Executor Agent: Execute all test cases and validate results
@@ -123,12 +585,31 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
     Returns:
         dict: Summary of test execution results with test_type information
     """
-    print(f"🚀 Executor Agent: Loading test cases from '{testcases_dir}'")
-    print(f"🔐 Authentication: {auth_type if auth_type else 'None'}")
+    global _log_users
+    with _log_users_lock:
+        if _log_users == 0:
+            _log_listener.start()
+        _log_users += 1
+    try:
+        return _execute_tests(testcases_dir, base_url, auth_type, test_type)
+    finally:
+        with _log_users_lock:
+            _log_users -= 1
+            if _log_users == 0:
+                # Drain queued output before returning to the caller
+                _log_listener.stop()
+
+
+def _execute_tests(testcases_dir, base_url, auth_type, test_type):
+    """Run execute_tests() while its log listener is active"""
+    logger.info(
+        f"🚀 Executor Agent: Loading test cases from '{testcases_dir}'\n"
+        f"🔐 Authentication: {auth_type if auth_type else 'None'}"
+    )
 
     # Check if testcases directory exists
     if not os.path.exists(testcases_dir):
-        print(f"❌ Error: Test cases directory '{testcases_dir}' not found")
+        logger.error(f"❌ Error: Test cases directory '{testcases_dir}' not found")
         return {"error": "Test cases directory not found"}
 
     # Determine test types to run
@@ -139,7 +620,7 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
         if os.path.exists(test_type_dir):
             test_types.append((test_type, test_type_dir))
         else:
-            print(f"❌ Error: Test type '{test_type}' directory not found")
+            logger.error(f"❌ Error: Test type '{test_type}' directory not found")
             return {"error": f"Test type '{test_type}' not found"}
     else:
         # Run all test types
@@ -149,170 +630,109 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
                 test_types.append((tt, tt_dir))
 
     if not test_types:
-        print(f"❌ Error: No test type directories with test cases found")
+        logger.error(f"❌ Error: No test type directories with test cases found")
         return {"error": "No test cases found"}
 
     # Track overall results
     total_tests = 0
     passed_tests = 0
     failed_tests = 0
-    all_results = []
     results_by_type = {}
 
+    executor = ThreadPoolExecutor(max_workers=max(1, PARALLELISM))
+    send = _bind_sender(base_url, auth_type)
+
     # Execute tests for each test type
     for current_test_type, test_type_dir in test_types:
-        print(f"\n{'='*80}")
-        print(f"📂 Test Type: {current_test_type.upper()}")
-        print(f"{'='*80}")
+        logger.info(f"\n{'='*80}\n📂 Test Type: {current_test_type.upper()}\n{'='*80}")
 
         # Get all test case files for this test type
-        test_files = [f for f in os.listdir(test_type_dir) if f.endswith('.json')]
+        with os.scandir(test_type_dir) as entries:
+            test_files = sorted(
+                (e for e in entries if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()),
+                key=lambda e: e.name
+            )
 
         if not test_files:
-            print(f"⚠️  No test cases found for {current_test_type}")
+            logger.warning(f"⚠️  No test cases found for {current_test_type}")
             continue
 
-        print(f"📋 Found {len(test_files)} test case file(s)")
+        logger.info(f"📋 Found {len(test_files)} test case file(s)")
 
         type_passed = 0
         type_failed = 0
         type_results = []
 
-        # Execute each test file
-        for test_file in sorted(test_files):
-            file_path = os.path.join(test_type_dir, test_file)
-            print(f"\n{'='*80}")
-            print(f"📄 Processing: {test_file}")
-            print(f"{'='*80}")
+        # Requests of all files are queued first; pending keeps each file's details in report order
+        pending = []
 
-            # Load test case
-            with open(file_path, 'r') as f:
-                test_data = json.load(f)
+        for entry in test_files:
+            test_file = entry.name
+
+            # Load test case (parsed once per file version)
+            test_data = _load_test_file(entry.path, entry.stat().st_mtime_ns)
 
             endpoint = test_data.get("endpoint", "")
             method = test_data.get("method", "GET").upper()
             test_cases = test_data.get("testCases", [])
 
-            print(f"🔗 Endpoint: {method} {endpoint}")
-            print(f"🧪 Test cases: {len(test_cases)}")
-
-            # Execute each test case for this endpoint
-            for idx, test_case in enumerate(test_cases, 1):
-                total_tests += 1
-                test_name = test_case.get("name", f"Test {idx}")
-                description = test_case.get("description", "")
-                request_body = test_case.get("requestBody", {})
-                params = test_case.get("params", None)
-                expected_status = test_case.get("expectedStatusCode", 200)
-
-                print(f"\n   🧪 Test {idx}: {test_name}")
-                print(f"      Description: {description}")
+            file_header = "\n".join([
+                f"\n{'='*80}",
+                f"📄 Processing: {test_file}",
+                f"{'='*80}",
+                f"🔗 Endpoint: {method} {endpoint}",
+                f"🧪 Test cases: {len(test_cases)}"
+            ])
+
+            # Requests run concurrently; validation is batched once the whole file has responded
+            request_futures = [
+                executor.submit(_send_request, endpoint, method, test_case, send)
+                for test_case in test_cases
+            ]
+            pending.append((file_header, test_file, endpoint, method, test_cases, request_futures))
+
+        # Per-file validation is queued behind every request of this test type, so a
+        # worker waiting on its file's requests never blocks requests still queued
+        file_futures = [
+            (
+                file_header,
+                (test_file, endpoint, method, test_cases),
+                executor.submit(_run_file, test_file, endpoint, method, test_cases, request_futures)
+            )
+            for file_header, test_file, endpoint, method, test_cases, request_futures in pending
+        ]
+
+        # Live results: one NDJSON line per test as soon as it is reported (tail -f friendly)
+        reports_dir = os.path.join(testcases_dir, current_test_type, "reports")
+        Utils.ensure_dir(reports_dir)
+        with open(os.path.join(reports_dir, f"results_{current_test_type}.ndjson"), "wb") as live_results:
+            # Report results in file order
+            for file_header, file_info, future in file_futures:
+                logger.info(file_header)
 
-                # Execute the API request using Utils smart method selection
                 try:
-                    # Separate path parameters from query parameters
-                    actual_endpoint = endpoint
-                    query_params = {}
-
-                    if params:
-                        for param_name, param_value in params.items():
-                            placeholder = f"{{{param_name}}}"
-                            if placeholder in actual_endpoint:
-                                # This is a path parameter
-                                actual_endpoint = actual_endpoint.replace(placeholder, str(param_value))
-                            else:
-                                # This is a query parameter
-                                query_params[param_name] = param_value
-
-                    # Use Utils.execute_request with smart auth handling
-                    response = Utils.execute_request(
-                        base_url=base_url,
-                        method=method,
-                        endpoint=actual_endpoint,
-                        request_body=request_body if request_body else None,
-                        params=query_params if query_params else None,
-                        auth_type=auth_type
-                    )
-
-                    actual_status = response.status_code
-
-                    # Try to parse response body as JSON
-                    try:
-                        response_body = response.json()
-                    except:
-                        response_body = response.text
-
-                    # Validate using LLM for intelligent validation
-                    validation_result = validate_with_llm(
-                        test_case=test_case,
-                        actual_status=actual_status,
-                        response_body=response_body,
-                        expected_status=expected_status
-                    )
-
-                    # Record result
-                    test_result = {
-                        "file": test_file,
-                        "test_name": test_name,
-                        "description": description,
-                        "endpoint": endpoint,
-                        "method": method,
-                        "expected_status": expected_status,
-                        "actual_status": actual_status,
-                        "passed": validation_result["passed"],
-                        "details": validation_result["details"],
-                        "response_body": response_body
-                    }
+                    file_results = future.result()
+                except Exception as e:
+                    # A failure while validating one file (e.g. cache or LLM client errors) only
+                    # errors that file's tests; the remaining files are still reported
+                    file_results = _error_results(*file_info, e)
 
-                    all_results.append(test_result)
-                    type_results.append(test_result)
+                for test_result, output in file_results:
+                    logger.info(output)
+                    live_results.write(Utils.to_json_bytes(test_result) + b"\n")
+                    live_results.flush()
+
+                    total_tests += 1
+                    if test_result["actual_status"] is not None:
+                        type_results.append(test_result)
 
                     # Update counters
-                    if validation_result["passed"]:
+                    if test_result["passed"]:
                         passed_tests += 1
                         type_passed += 1
-                        print(f"      ✅ PASSED")
                     else:
                         failed_tests += 1
                         type_failed += 1
-                        print(f"      ❌ FAILED")
-
-                    print(f"      Expected: {expected_status}, Got: {actual_status}")
-                    if validation_result["details"]:
-                        print(f"      Details: {validation_result['details']}")
-
-                except ValueError as e:
-                    print(f"      ❌ Error: {str(e)}")
-                    failed_tests += 1
-                    type_failed += 1
-                    all_results.append({
-                        "file": test_file,
-                        "test_name": test_name,
-                        "description": description,
-                        "endpoint": endpoint,
-                        "method": method,
-                        "expected_status": expected_status,
-                        "actual_status": None,
-                        "passed": False,
-                        "details": str(e),
-                        "response_body": None
-                    })
-                except Exception as e:
-                    print(f"      ❌ Unexpected error: {str(e)}")
-                    failed_tests += 1
-                    type_failed += 1
-                    all_results.append({
-                        "file": test_file,
-                        "test_name": test_name,
-                        "description": description,
-                        "endpoint": endpoint,
-                        "method": method,
-                        "expected_status": expected_status,
-                        "actual_status": None,
-                        "passed": False,
-                        "details": f"Error: {str(e)}",
-                        "response_body": None
-                    })
 
         # Store results for this test type
         results_by_type[current_test_type] = {
@@ -322,18 +742,27 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
             "results": type_results
         }
 
+    executor.shutdown()
+
     # Print summary
-    print(f"\n{'='*80}")
-    print(f"📊 Execution Summary")
-    print(f"{'='*80}")
-    print(f"Total Tests: {total_tests}")
-    print(f"✅ Passed: {passed_tests}")
-    print(f"❌ Failed: {failed_tests}")
+    summary_lines = [
+        f"\n{'='*80}",
+        f"📊 Execution Summary",
+        f"{'='*80}",
+        f"Total Tests: {total_tests}",
+        f"✅ Passed: {passed_tests}",
+        f"❌ Failed: {failed_tests}"
+    ]
 
     pass_rate = 0
     if total_tests > 0:
         pass_rate = (passed_tests / total_tests) * 100
-        print(f"📈 Pass Rate: {pass_rate:.1f}%")
+        summary_lines.append(f"📈 Pass Rate: {pass_rate:.1f}%")
+
+    cache_stats = llm_cache.stats() if llm_cache is not None else None
+    if cache_stats:
+        summary_lines.append(f"🗄️  LLM cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es)")
+    logger.info("\n".join(summary_lines))
 
     # Save results for each test type
     saved_reports = {}
@@ -354,13 +783,10 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
                 "results": type_data['results']
             }
 
-            # Save JSON report
-            json_path = Utils.save_json_report(test_results_data, test_type_name, testcases_dir)
-            print(f"\n💾 {test_type_name.upper()} JSON report saved to: {json_path}")
-
-            # Save HTML report
-            html_path = Utils.save_html_report(test_results_data, test_type_name, testcases_dir)
-            print(f"🌐 {test_type_name.upper()} HTML report saved to: {html_path}")
+            # Save JSON and HTML reports (results serialized once for both)
+            json_path, html_path = Utils.save_reports(test_results_data, test_type_name, testcases_dir)
+            logger.info(f"\n💾 {test_type_name.upper()} JSON report saved to: {json_path}")
+            logger.info(f"🌐 {test_type_name.upper()} HTML report saved to: {html_path}")
 
             saved_reports[test_type_name] = {
                 "json": json_path,
@@ -373,6 +799,7 @@ def execute_tests(testcases_dir=TESTCASES_DIR, base_url=BASE_URL, auth_type=AUTH
         "failed": failed_tests,
         "pass_rate": f"{pass_rate:.1f}%" if total_tests > 0 else "0%",
         "reports": saved_reports,
+        "llm_cache": cache_stats,
         "results_by_type": results_by_type
     }
 
@@ -1,9 +1,10 @@
 import os
 import json
-import requests
+import hashlib
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from llm_client import LLMClient
-from utils import Utils
+from utils import Utils, HTTP_TIMEOUT
 
 # ===== Load global config =====
 global_config = Utils.read_config()
@@ -21,14 +22,170 @@ LLM_VENDOR = agent_config.get("llm_vendor", "anthropic")
 LLM_MODEL = agent_config.get("llm_model", "claude-3")
 TEMPERATURE = agent_config.get("temperature", 0)
 MAX_TOKENS = agent_config.get("max_tokens", 4096)
+# Hardlink identical test case files across test types instead of writing a copy per type
+DEDUPE_ACROSS_TYPES = agent_config.get("dedupe_across_types", False)
+# Generate a separate plan per test type through the vendor's (discounted, offline) batch API
+USE_BATCH_API = agent_config.get("use_batch_api", False)
+BATCH_POLL_INTERVAL = agent_config.get("batch_poll_interval", 10)
+BATCH_TIMEOUT = agent_config.get("batch_timeout", 3600)
 
 # Load test case generator prompt from file
 TEST_PROMPT = Utils.read_prompt(script_name)
 
+# Per test type sidecar index: filename -> {"hash", "mtime_ns"} of the last content written/verified
+INDEX_FILENAME = ".index.json"
+
 # ===== Initialize LLM client =====
 # Validation happens inside LLMClient constructor
 client = LLMClient(vendor=LLM_VENDOR, model=LLM_MODEL, temperature=TEMPERATURE)
 
+def _content_hash(data):
+    """Stable content hash of a test case document (key order independent)"""
+    return hashlib.blake2b(Utils.to_json_bytes(data, sort_keys=True), digest_size=16).hexdigest()
+
+
+def _load_index(test_type_dir):
+    """Load a test type's content index (empty if missing or unreadable)"""
+    try:
+        with open(os.path.join(test_type_dir, INDEX_FILENAME), "rb") as f:
+            return Utils.from_json(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(test_type_dir, index):
+    """Atomically write a test type's content index"""
+    index_path = os.path.join(test_type_dir, INDEX_FILENAME)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(Utils.to_json_bytes(index))
+    os.replace(tmp_path, index_path)
+
+
+def _endpoint_filename(ep):
+    """Build the test case filename for an endpoint entry of the test plan"""
+    # Generate clean filename from endpoint path
+    endpoint_path = ep["endpoint"]
+    # Remove curly braces from path parameters
+    clean_path = endpoint_path.replace("{", "").replace("}", "")
+    # Replace slashes with underscores and strip leading/trailing underscores
+    filename = clean_path.replace("/", "_").strip("_")
+    # Add method to make it unique if multiple methods for same endpoint
+    method = ep.get("method", "").lower()
+    if method:
+        return f"{filename}_{method}.json"
+    return f"{filename}.json"
+
+
+def _write_test_file(file_path, ep, link_source=None):
+    """
+    Atomically write a test case file (temp file + rename)
+
+    Args:
+        file_path: Destination path
+        ep: Endpoint test plan entry to store
+        link_source: Existing file with identical content to hardlink instead of writing
+            (falls back to a normal write if the filesystem refuses the link)
+    """
+    tmp_path = f"{file_path}.tmp"
+    if link_source is not None:
+        try:
+            if os.path.lexists(tmp_path):
+                os.unlink(tmp_path)
+            os.link(link_source, tmp_path)
+            os.replace(tmp_path, file_path)
+            return
+        except OSError:
+            pass
+
+    with open(tmp_path, "wb") as f:
+        f.write(Utils.to_json_bytes(ep, indent=True))
+    os.replace(tmp_path, file_path)
+
+
+def _remove_file(file_path):
+    """Delete a file; one already removed (e.g. by a concurrent run) is not an error"""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def _materialize_one(test_type_dir, filename, ep, exists, index_entry, link_source=None):
+    """
+    Create or update one test case file if its content changed
+
+    Args:
+        test_type_dir: Directory of the test type
+        filename: Test case filename
+        ep: Endpoint test plan entry to store
+        exists: Whether the file was present when the directory was listed
+        index_entry: This file's entry from the content index (or None)
+        link_source: (path, content hash) of the same file already materialized for another
+            test type; hardlinked when the content matches (or None)
+
+    Returns:
+        tuple: (status, filename, new index entry) with status "added", "updated" or "unchanged"
+    """
+    file_path = os.path.join(test_type_dir, filename)
+    ep_hash = _content_hash(ep)
+
+    # Check if file exists and compare content
+    if exists:
+        # Index hit: same content hash and the file hasn't been touched since
+        entry = index_entry or {}
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        if entry.get("hash") == ep_hash and entry.get("mtime_ns") == mtime_ns:
+            status = "unchanged"
+        else:
+            with open(file_path, "rb") as f:
+                existing_content = Utils.from_json(f.read())
+            status = "unchanged" if existing_content == ep else "updated"
+    else:
+        status = "added"
+
+    if status != "unchanged":
+        link_path = link_source[0] if link_source and link_source[1] == ep_hash else None
+        _write_test_file(file_path, ep, link_path)
+        mtime_ns = os.stat(file_path).st_mtime_ns
+
+    return status, filename, {"hash": ep_hash, "mtime_ns": mtime_ns}
+
+
+def _parse_test_plan(response_text, output_dir, debug_filename="llm_response_debug.txt"):
+    """
+    Parse the JSON test plan (fenced or bare) from an LLM response
+
+    Args:
+        response_text: Raw LLM response
+        output_dir: Directory for the debug file written on a parse error
+        debug_filename: Name of the debug file
+
+    Returns:
+        list: Test plan entries
+
+    Raises:
+        json.JSONDecodeError: If the response holds no valid JSON
+    """
+    try:
+        return Utils.extract_json(response_text)
+    except json.JSONDecodeError as e:
+        # Save the problematic response for debugging
+        debug_file = os.path.join(output_dir, debug_filename)
+        with open(debug_file, "w") as f:
+            f.write(f"JSON Parse Error: {str(e)}\n")
+            f.write(f"Error at line {e.lineno}, column {e.colno}\n\n")
+            f.write("=" * 80 + "\n")
+            f.write("Raw LLM Response:\n")
+            f.write("=" * 80 + "\n")
+            f.write(response_text)
+
+        print(f"❌ JSON parsing failed: {str(e)}")
+        print(f"📝 Debug info saved to: {debug_file}")
+        print(f"\n💡 Tip: The LLM may have generated invalid JSON. Check the debug file for details.")
+        raise
+
+
 # ===== Planner function: generate test cases =====
 def generate_tests(openapi_url=OPENAPI_URL, output_dir=OUTPUT_DIR, base_url=BASE_URL, test_type=None):
     """
@@ -57,56 +214,42 @@ def generate_tests(openapi_url=OPENAPI_URL, output_dir=OUTPUT_DIR, base_url=BASE
     print(f"🧠 Planner Agent: Fetching OpenAPI schema from {openapi_url}")
 
     # Fetch OpenAPI JSON
-    schema = requests.get(openapi_url).json()
-
-    # Prompt LLM to generate test cases (only once)
-    print(f"🧠 Test Case Generator Agent: Generating test cases using {LLM_VENDOR}/{LLM_MODEL}")
-
-    response_text = client.generate(
-        system_prompt=TEST_PROMPT,
-        user_message=json.dumps(schema),
-        max_tokens=MAX_TOKENS
-    )
-
-    # Try to extract JSON from markdown code blocks if present
-    if "```json" in response_text:
-        start = response_text.find("```json") + 7
-        end = response_text.find("```", start)
-        response_text = response_text[start:end].strip()
-    elif "```" in response_text:
-        start = response_text.find("```") + 3
-        end = response_text.find("```", start)
-        response_text = response_text[start:end].strip()
+    schema = Utils.from_json(Utils.get_session().get(openapi_url, timeout=HTTP_TIMEOUT).content)
+    schema_json = Utils.to_json(schema)
+
+    if USE_BATCH_API and len(test_types_to_generate) > 1:
+        # One plan per test type, generated together as a single batch job
+        print(f"🧠 Test Case Generator Agent: Submitting batch of {len(test_types_to_generate)} test plans to {LLM_VENDOR}/{LLM_MODEL}")
+        responses = client.generate_batch(
+            system_prompt=TEST_PROMPT,
+            user_messages={tt: f"Generate {tt} test cases." for tt in test_types_to_generate},
+            max_tokens=MAX_TOKENS,
+            shared_prefix=schema_json,
+            poll_interval=BATCH_POLL_INTERVAL,
+            timeout=BATCH_TIMEOUT
+        )
+        test_plans = {
+            tt: _parse_test_plan(responses[tt], output_dir, f"llm_response_debug_{tt}.txt")
+            for tt in test_types_to_generate
+        }
     else:
-        # Try to find JSON array or object in the response
-        # Look for the first [ or { character
-        json_start = -1
-        for i, char in enumerate(response_text):
-            if char in '[{':
-                json_start = i
-                break
-
-        if json_start != -1:
-            response_text = response_text[json_start:]
-
-    # Try to parse JSON with better error handling
-    try:
-        test_plan = json.loads(response_text)
-    except json.JSONDecodeError as e:
-        # Save the problematic response for debugging
-        debug_file = os.path.join(output_dir, "llm_response_debug.txt")
-        with open(debug_file, "w") as f:
-            f.write(f"JSON Parse Error: {str(e)}\n")
-            f.write(f"Error at line {e.lineno}, column {e.colno}\n\n")
-            f.write("=" * 80 + "\n")
-            f.write("Raw LLM Response:\n")
-            f.write("=" * 80 + "\n")
-            f.write(response_text)
+        # Prompt LLM to generate test cases (only once)
+        print(f"🧠 Test Case Generator Agent: Generating test cases using {LLM_VENDOR}/{LLM_MODEL}")
 
-        print(f"❌ JSON parsing failed: {str(e)}")
-        print(f"📝 Debug info saved to: {debug_file}")
-        print(f"\n💡 Tip: The LLM may have generated invalid JSON. Check the debug file for details.")
-        raise
+        response_text = client.generate(
+            system_prompt=TEST_PROMPT,
+            user_message=schema_json,
+            max_tokens=MAX_TOKENS,
+            cache_user_message=True
+        )
+        test_plan = _parse_test_plan(response_text, output_dir)
+        test_plans = dict.fromkeys(test_types_to_generate, test_plan)
+
+    # Thread pool for test case file I/O
+    io_pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+    # filename -> (path, content hash) of the file materialized for the first test type
+    link_sources = {}
 
     # Process each test type
     total_added = 0
@@ -126,59 +269,57 @@ def generate_tests(openapi_url=OPENAPI_URL, output_dir=OUTPUT_DIR, base_url=BASE
         # Get list of existing test files for this test type
         existing_files = set()
         if os.path.exists(test_type_dir):
-            existing_files = {f for f in os.listdir(test_type_dir) if f.endswith('.json')}
+            with os.scandir(test_type_dir) as entries:
+                existing_files = {
+                    e.name for e in entries
+                    if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()
+                }
+
+        # Hashes of files as last written; lets unchanged files be skipped without reading them
+        index = _load_index(test_type_dir)
+
+        # One file per endpoint; if two endpoints map to the same file the last one wins
+        planned = {}
+        for ep in test_plans[current_test_type]:
+            planned[_endpoint_filename(ep)] = ep
+        new_files = set(planned)
+
+        # Compare/write files concurrently; map() keeps results in plan order for reporting
+        results = list(io_pool.map(
+            lambda item: _materialize_one(
+                test_type_dir, item[0], item[1], item[0] in existing_files, index.get(item[0]),
+                link_sources.get(item[0])
+            ),
+            planned.items()
+        ))
 
-        # Track which files we're keeping/creating
-        new_files = set()
         added_count = 0
         updated_count = 0
         unchanged_count = 0
+        new_index = {}
 
-        # Process each endpoint's test cases
-        for ep in test_plan:
-            # Generate clean filename from endpoint path
-            endpoint_path = ep["endpoint"]
-            # Remove curly braces from path parameters
-            clean_path = endpoint_path.replace("{", "").replace("}", "")
-            # Replace slashes with underscores and strip leading/trailing underscores
-            filename = clean_path.replace("/", "_").strip("_")
-            # Add method to make it unique if multiple methods for same endpoint
-            method = ep.get("method", "").lower()
-            if method:
-                filename = f"{filename}_{method}.json"
-            else:
-                filename = f"{filename}.json"
-
-            new_files.add(filename)
-            file_path = os.path.join(test_type_dir, filename)
-
-            # Check if file exists and compare content
-            if os.path.exists(file_path):
-                with open(file_path, "r") as f:
-                    existing_content = json.load(f)
-
-                # Compare new vs existing content
-                if existing_content == ep:
-                    unchanged_count += 1
-                    print(f"   ⏭️  Unchanged: {filename}")
-                else:
-                    updated_count += 1
-                    print(f"   ♻️  Updated: {filename}")
-                    with open(file_path, "w") as f:
-                        json.dump(ep, f, indent=2)
-            else:
+        for status, filename, index_entry in results:
+            new_index[filename] = index_entry
+            if DEDUPE_ACROSS_TYPES:
+                link_sources.setdefault(filename, (os.path.join(test_type_dir, filename), index_entry["hash"]))
+            if status == "added":
                 added_count += 1
                 print(f"   ➕ Added: {filename}")
-                with open(file_path, "w") as f:
-                    json.dump(ep, f, indent=2)
+            elif status == "updated":
+                updated_count += 1
+                print(f"   ♻️  Updated: {filename}")
+            else:
+                unchanged_count += 1
+                print(f"   ⏭️  Unchanged: {filename}")
 
         # Delete obsolete test files (files that exist but are not in new test plan)
-        deleted_count = 0
-        obsolete_files = existing_files - new_files
+        obsolete_files = sorted(existing_files - new_files)
+        list(io_pool.map(_remove_file, (os.path.join(test_type_dir, f) for f in obsolete_files)))
+        deleted_count = len(obsolete_files)
         for obsolete_file in obsolete_files:
-            deleted_count += 1
             print(f"   ➖ Deleted: {obsolete_file}")
-            os.remove(os.path.join(test_type_dir, obsolete_file))
+
+        _save_index(test_type_dir, new_index)
 
         # Update totals
         total_added += added_count
@@ -189,6 +330,8 @@ def generate_tests(openapi_url=OPENAPI_URL, output_dir=OUTPUT_DIR, base_url=BASE
         # Per test type summary
         print(f"   📊 {current_test_type.upper()} Summary: {added_count} added, {updated_count} updated, {unchanged_count} unchanged, {deleted_count} deleted")
 
+    io_pool.shutdown()
+
     # Overall summary
     print(f"\n{'='*80}")
     print(f"✅ Test cases managed in '{output_dir}' directory.")
@@ -1,8 +1,163 @@
 import os
+import re
 import sys
 import json
+import heapq
+import functools
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+# Connection pool settings for API requests
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    # Only idempotent methods are retried after a read error or retryable status
+    allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]),
+    # Return the final response instead of raising, so tests expecting 5xx still see it
+    raise_on_status=False
+)
+# Default (connect, read) timeout in seconds, so a hanging server can't stall a test run
+HTTP_TIMEOUT = (3.05, 27)
+
+# Per reports directory index of {timestamp, summary, filename} records, oldest first
+HISTORY_INDEX_FILENAME = ".history.json"
+HISTORY_INDEX_MAX = 100
+
+# Bytes read from the start of a report to find its header fields (summary precedes results)
+REPORT_HEAD_BYTES = 64 * 1024
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+# Supported HTTP methods -> (sends JSON body, sends query parameters)
+_METHOD_TABLE = {
+    "GET": (False, True),
+    "POST": (True, False),
+    "PUT": (True, False),
+    "PATCH": (True, False),
+    "DELETE": (False, False),
+}
+
+# Markdown code fence around JSON in LLM responses
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+_JSON_DECODER = json.JSONDecoder()
+
+# First character that can start a JSON document, per set of accepted opening characters
+_JSON_START_RES = {
+    "{[": re.compile(r"[\[{]"),
+    "{": re.compile(r"\{"),
+    "[": re.compile(r"\["),
+}
+
+@functools.lru_cache(maxsize=32)
+def _read_json_file(path, mtime_ns):
+    """Parse a JSON file once per version (backs Utils.read_config); mtime_ns only keys the cache"""
+    with open(path, "rb") as f:
+        return Utils.from_json(f.read())
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_file(path, mtime_ns):
+    """Read a text file once per version (backs Utils.read_prompt); mtime_ns only keys the cache"""
+    with open(path, "r") as f:
+        return f.read()
+
+
+# Headers for unauthenticated requests
+_NO_HEADERS = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=8)
+def _auth_for(auth_type, username, password, token):
+    """Build (headers, auth) for an auth type and credentials (backs Utils.get_auth_headers)"""
+    headers = {}
+    auth = None
+
+    if auth_type == "basic":
+        # HTTP Basic Auth - credentials from API_USERNAME / API_PASSWORD
+        if username and password:
+            auth = HTTPBasicAuth(username, password)
+        else:
+            raise ValueError("API_USERNAME and API_PASSWORD environment variables required for basic auth")
+
+    elif auth_type in ["bearer", "token"]:
+        # Bearer token authentication - token from API_TOKEN
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        else:
+            raise ValueError("API_TOKEN environment variable required for bearer/token auth")
+
+    # Shared by every caller with these credentials, so handed out read-only
+    return MappingProxyType(headers), auth
+
+
+# HTML report template, resolved once relative to this module
+REPORT_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "test_report.html")
+
+# Directories already created by Utils.ensure_dir in this process
+_ensured_dirs = set()
+
+# <script> and </script> inside JSON embedded in the HTML report (escaped in one pass)
+_SCRIPT_TAG_RE = re.compile(r"<(/?)script>")
+
+# {{variable}} placeholders filled in by Utils._generate_html_dashboard (unknown names are left as is)
+_TEMPLATE_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_template(path):
+    """
+    Read and precompile a report template once per process
+
+    Returns:
+        tuple: Parts alternating literal text (even indexes) and placeholder names (odd indexes)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return tuple(_TEMPLATE_VAR_RE.split(f.read()))
+
+
+def _render_template(parts, values):
+    """Fill a precompiled template; unknown placeholder names are left as {{name}}"""
+    return "".join(
+        part if i % 2 == 0 else values.get(part, f"{{{{{part}}}}}")
+        for i, part in enumerate(parts)
+    )
+
+
+def _script_json(obj):
+    """Serialize an object as JSON for safe embedding in an HTML <script> block"""
+    return _escape_script(Utils.to_json(obj))
+
+
+def _escape_script(json_str):
+    """Make JSON text safe to embed in an HTML <script> block"""
+    # JSON serialization already properly escapes strings, but we need to escape script tags
+    # to prevent them from breaking out of the script block
+    # The browser HTML parser will see </script> even inside JSON strings
+    return _SCRIPT_TAG_RE.sub(r'<\\\1script>', json_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _history_blobs(labels, passed, failed):
+    """Serialized history chart data (labels, passed, failed); arguments are tuples"""
+    return _script_json(labels), _script_json(passed), _script_json(failed)
+
+
+# One requests.Session per thread (sessions aren't guaranteed to be thread-safe)
+_thread_local = threading.local()
 
 
 class Utils:
@@ -39,38 +194,38 @@ class Utils:
         """
         # Load LLM vendors configuration
         llm_vendors_path = os.path.join(os.path.dirname(__file__), "llm_vendors.json")
-        with open(llm_vendors_path, 'r') as f:
-            vendors_config = json.load(f)
+        vendors_config = Utils.read_config(llm_vendors_path)
 
         # If specific vendor provided, validate only that one
         if vendor:
-            vendors_to_check = {vendor.lower(): vendors_config.get(vendor.lower())}
-            if not vendors_to_check[vendor.lower()]:
+            vendor_lc = vendor.lower()
+            vendors_to_check = {vendor_lc: vendors_config.get(vendor_lc)}
+            if not vendors_to_check[vendor_lc]:
                 print(f"\n❌ Unknown vendor: {vendor}")
                 print(f"   Supported vendors: {', '.join(vendors_config.keys())}\n")
                 sys.exit(1)
         else:
             # Load config and collect all vendors used by agents
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+                config = Utils.read_config(config_path)
             except FileNotFoundError:
                 print(f"\n❌ Configuration file not found: {config_path}\n")
                 sys.exit(1)
 
             vendors_to_check = {}
             for agent_name, agent_config in config.get("agents", {}).items():
-                agent_vendor = agent_config.get("llm_vendor")
-                if agent_vendor and agent_vendor.lower() in vendors_config:
-                    vendors_to_check[agent_vendor.lower()] = vendors_config[agent_vendor.lower()]
+                agent_vendor = (agent_config.get("llm_vendor") or "").lower()
+                if agent_vendor in vendors_config:
+                    vendors_to_check[agent_vendor] = vendors_config[agent_vendor]
 
-        # Validate API keys for each vendor
+        # Validate API keys for each vendor (plain lookups on the live environment mapping)
+        env = os.environ
         validated_keys = {}
         missing_vendors = []
 
         for vendor_name, vendor_info in vendors_to_check.items():
             primary_key = vendor_info["env_var"]
-            api_key = os.getenv(primary_key)
+            api_key = env.get(primary_key)
 
             if not api_key or api_key.strip() == "":
                 missing_vendors.append({
@@ -84,7 +239,7 @@ class Utils:
                 if "additional_env_vars" in vendor_info:
                     missing_additional = []
                     for var in vendor_info["additional_env_vars"]:
-                        if not os.getenv(var):
+                        if not env.get(var):
                             missing_additional.append(var)
 
                     if missing_additional:
@@ -101,70 +256,182 @@ class Utils:
 
         # If any vendors have missing keys, show error and exit
         if missing_vendors:
-            print("\n" + "="*80)
-            print("❌ LLM AUTHENTICATION ERROR")
-            print("="*80)
-            print("🔑 Missing required API keys for the following LLM vendors:\n")
-
+            # Build the whole message and write it at once
+            lines = [
+                "",
+                "="*80,
+                "❌ LLM AUTHENTICATION ERROR",
+                "="*80,
+                "🔑 Missing required API keys for the following LLM vendors:\n"
+            ]
+
+            # One pass over the missing vendors fills the details and both setup snippets
+            export_lines = []
+            env_lines = []
             for missing in missing_vendors:
                 vendor = missing["vendor"].upper()
+                env_var = missing.get("env_var")
+                missing_additional = missing.get("missing_additional")
 
-                if missing.get("env_var"):
+                if env_var:
                     # Missing primary key
-                    print(f"   {vendor}:")
-                    print(f"   - Missing: {missing['env_var']}")
-                    print(f"   - Get your key from: {missing['console_url']}")
+                    lines.append(f"   {vendor}:")
+                    lines.append(f"   - Missing: {env_var}")
+                    lines.append(f"   - Get your key from: {missing['console_url']}")
 
                     if missing.get("additional_vars"):
-                        print(f"   - Also required: {', '.join(missing['additional_vars'])}")
-                    print()
-                elif missing.get("missing_additional"):
-                    # Has primary key but missing additional vars
-                    print(f"   {vendor}:")
-                    print(f"   - Missing additional variables: {', '.join(missing['missing_additional'])}")
-                    print(f"   - See documentation: {missing['console_url']}")
-                    print()
-
-            print("📝 Set the required environment variables using one of these methods:\n")
-            print("   Option 1 - Export in current session:")
-            for missing in missing_vendors:
-                if missing.get("env_var"):
-                    print(f"   export {missing['env_var']}='your-api-key-here'")
-                if missing.get("missing_additional"):
-                    for var in missing["missing_additional"]:
-                        print(f"   export {var}='your-value-here'")
-
-            print("\n   Option 2 - Add to .env file in project root:")
-            for missing in missing_vendors:
-                if missing.get("env_var"):
-                    print(f"   {missing['env_var']}=your-api-key-here")
-                if missing.get("missing_additional"):
-                    for var in missing["missing_additional"]:
-                        print(f"   {var}=your-value-here")
-
-            print("\n" + "="*80 + "\n")
+                        lines.append(f"   - Also required: {', '.join(missing['additional_vars'])}")
+                    lines.append("")
+                    export_lines.append(f"   export {env_var}='your-api-key-here'")
+                    env_lines.append(f"   {env_var}=your-api-key-here")
+                if missing_additional:
+                    if not env_var:
+                        # Has primary key but missing additional vars
+                        lines.append(f"   {vendor}:")
+                        lines.append(f"   - Missing additional variables: {', '.join(missing_additional)}")
+                        lines.append(f"   - See documentation: {missing['console_url']}")
+                        lines.append("")
+                    for var in missing_additional:
+                        export_lines.append(f"   export {var}='your-value-here'")
+                        env_lines.append(f"   {var}=your-value-here")
+
+            lines.append("📝 Set the required environment variables using one of these methods:\n")
+            lines.append("   Option 1 - Export in current session:")
+            lines.extend(export_lines)
+            lines.append("\n   Option 2 - Add to .env file in project root:")
+            lines.extend(env_lines)
+
+            lines.append("\n" + "="*80 + "\n")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             sys.exit(1)
 
         return validated_keys if not vendor else validated_keys.get(vendor.lower())
 
+    @staticmethod
+    def to_json(obj, indent=False, sort_keys=False):
+        """
+        Serialize an object to a JSON string (uses orjson when available)
+
+        Args:
+            obj: JSON-serializable object
+            indent: Pretty-print with 2-space indentation (default: compact)
+            sort_keys: Sort object keys, for stable output (default: insertion order)
+
+        Returns:
+            str: JSON text
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=Utils._orjson_option(indent, sort_keys)).decode("utf-8")
+            except TypeError:
+                # Values orjson rejects (e.g. non-string keys) go through the stdlib below
+                pass
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+
+    @staticmethod
+    def to_json_bytes(obj, indent=False, sort_keys=False):
+        """
+        Serialize an object to UTF-8 encoded JSON bytes (uses orjson when available)
+
+        Args:
+            obj: JSON-serializable object
+            indent: Pretty-print with 2-space indentation (default: compact)
+            sort_keys: Sort object keys, for stable output (default: insertion order)
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=Utils._orjson_option(indent, sort_keys))
+            except TypeError:
+                pass
+        return Utils.to_json(obj, indent, sort_keys).encode("utf-8")
+
+    @staticmethod
+    def _orjson_option(indent, sort_keys):
+        """Build the orjson option flags for to_json/to_json_bytes"""
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option or None
+
+    @staticmethod
+    def from_json(data):
+        """
+        Parse JSON text or bytes (uses orjson when available)
+
+        Args:
+            data: JSON document as str or bytes
+
+        Returns:
+            Parsed Python object
+
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    @staticmethod
+    def extract_json(text, open_chars="{["):
+        """
+        Parse the first JSON document in an LLM response in a single pass
+
+        Takes the contents of a markdown code fence if present, then decodes from the
+        first opening character; trailing prose after the document is ignored.
+
+        Args:
+            text: Raw LLM response
+            open_chars: Characters that may start the document (default: object or array)
+
+        Returns:
+            Parsed Python object
+
+        Raises:
+            json.JSONDecodeError: If no valid JSON document is found
+        """
+        match = _JSON_FENCE_RE.search(text)
+        if match:
+            text = match.group(1)
+
+        start_re = _JSON_START_RES.get(open_chars)
+        if start_re is None:
+            start_re = re.compile(f"[{re.escape(open_chars)}]")
+        start = start_re.search(text)
+
+        obj, _ = _JSON_DECODER.raw_decode(text, start.start() if start else 0)
+        return obj
+
     @staticmethod
     def read_config(config_path="config.json"):
         """
         Read and parse the global configuration file
 
+        The file is parsed once per version (re-read after it is modified); every caller
+        shares the returned dict, so it must not be mutated.
+
         Args:
             config_path: Path to the config JSON file (default: config.json)
 
         Returns:
             dict: Parsed configuration dictionary
         """
-        with open(config_path, "r") as f:
-            return json.load(f)
+        # Key the cache on the absolute path so "config.json" and "./config.json" share an entry,
+        # and on the modification time so an edited file is re-read
+        path = os.path.abspath(config_path)
+        return _read_json_file(path, os.stat(path).st_mtime_ns)
 
     @staticmethod
     def read_prompt(script_name, prompts_dir="prompts"):
         """
-        Read the prompt file for a given agent/script
+        Read the prompt file for a given agent/script (read once per file version)
 
         Args:
             script_name: Name of the script/agent (e.g., 'master', 'planner')
@@ -173,9 +440,8 @@ class Utils:
         Returns:
             str: Content of the prompt file
         """
-        prompt_path = os.path.join(prompts_dir, f"{script_name}.prompt")
-        with open(prompt_path, "r") as f:
-            return f.read()
+        prompt_path = os.path.abspath(os.path.join(prompts_dir, f"{script_name}.prompt"))
+        return _read_text_file(prompt_path, os.stat(prompt_path).st_mtime_ns)
 
     @staticmethod
     def get_script_name(file_path):
@@ -219,35 +485,37 @@ class Utils:
             auth_type: Type of authentication ('basic', 'bearer', 'token', or None)
 
         Returns:
-            tuple: (headers dict, auth object) for requests
+            tuple: (read-only headers mapping, auth object) for requests; both are shared
+                between calls with the same credentials
         """
-        headers = {}
-        auth = None
-
         if auth_type is None:
             # No authentication
-            return headers, auth
+            return _NO_HEADERS, None
 
-        auth_type_lower = auth_type.lower()
+        # Credentials come from the environment; the cache key includes them so changes are picked up
+        return _auth_for(
+            auth_type.lower(), os.getenv("API_USERNAME"), os.getenv("API_PASSWORD"), os.getenv("API_TOKEN")
+        )
 
-        if auth_type_lower == "basic":
-            # HTTP Basic Auth - get credentials from environment
-            username = os.getenv("API_USERNAME")
-            password = os.getenv("API_PASSWORD")
-            if username and password:
-                auth = HTTPBasicAuth(username, password)
-            else:
-                raise ValueError("API_USERNAME and API_PASSWORD environment variables required for basic auth")
+    @staticmethod
+    def get_session():
+        """
+        Get the calling thread's pooled requests.Session
 
-        elif auth_type_lower in ["bearer", "token"]:
-            # Bearer token authentication
-            token = os.getenv("API_TOKEN")
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-            else:
-                raise ValueError("API_TOKEN environment variable required for bearer/token auth")
+        The session keeps connections alive between requests, so repeated calls to
+        the same host skip DNS lookups and TCP/TLS handshakes.
 
-        return headers, auth
+        Returns:
+            requests.Session: Session with a pooled, retrying HTTPAdapter mounted
+        """
+        session = getattr(_thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _thread_local.session = session
+        return session
 
     @staticmethod
     def execute_get(base_url, endpoint, params=None, auth_type=None):
@@ -263,9 +531,7 @@ class Utils:
         Returns:
             Response object
         """
-        url = f"{base_url}{endpoint}"
-        headers, auth = Utils.get_auth_headers(auth_type)
-        return requests.get(url, params=params, headers=headers, auth=auth)
+        return Utils.execute_request(base_url, "GET", endpoint, params=params, auth_type=auth_type)
 
     @staticmethod
     def execute_post(base_url, endpoint, request_body=None, auth_type=None):
@@ -281,9 +547,7 @@ class Utils:
         Returns:
             Response object
         """
-        url = f"{base_url}{endpoint}"
-        headers, auth = Utils.get_auth_headers(auth_type)
-        return requests.post(url, json=request_body, headers=headers, auth=auth)
+        return Utils.execute_request(base_url, "POST", endpoint, request_body=request_body, auth_type=auth_type)
 
     @staticmethod
     def execute_put(base_url, endpoint, request_body=None, auth_type=None):
@@ -299,9 +563,7 @@ class Utils:
         Returns:
             Response object
         """
-        url = f"{base_url}{endpoint}"
-        headers, auth = Utils.get_auth_headers(auth_type)
-        return requests.put(url, json=request_body, headers=headers, auth=auth)
+        return Utils.execute_request(base_url, "PUT", endpoint, request_body=request_body, auth_type=auth_type)
 
     @staticmethod
     def execute_patch(base_url, endpoint, request_body=None, auth_type=None):
@@ -317,9 +579,7 @@ class Utils:
         Returns:
             Response object
         """
-        url = f"{base_url}{endpoint}"
-        headers, auth = Utils.get_auth_headers(auth_type)
-        return requests.patch(url, json=request_body, headers=headers, auth=auth)
+        return Utils.execute_request(base_url, "PATCH", endpoint, request_body=request_body, auth_type=auth_type)
 
     @staticmethod
     def execute_delete(base_url, endpoint, auth_type=None):
@@ -334,12 +594,11 @@ class Utils:
         Returns:
             Response object
         """
-        url = f"{base_url}{endpoint}"
-        headers, auth = Utils.get_auth_headers(auth_type)
-        return requests.delete(url, headers=headers, auth=auth)
+        return Utils.execute_request(base_url, "DELETE", endpoint, auth_type=auth_type)
 
     @staticmethod
-    def execute_request(base_url, method, endpoint, request_body=None, params=None, auth_type=None):
+    def execute_request(base_url, method, endpoint, request_body=None, params=None, auth_type=None,
+                        timeout=HTTP_TIMEOUT):
         """
         Smart method to execute the appropriate HTTP request based on method type
 
@@ -350,6 +609,7 @@ class Utils:
             request_body: Request body for POST/PUT/PATCH
             params: Query parameters for GET
             auth_type: Authentication type ('basic', 'bearer', 'token', or None)
+            timeout: Seconds, or a (connect, read) tuple, before the request fails (default: HTTP_TIMEOUT)
 
         Returns:
             Response object
@@ -357,23 +617,99 @@ class Utils:
         Raises:
             ValueError: If method is not supported
         """
+        headers, auth = Utils.get_auth_headers(auth_type)
+        return Utils._request(method, f"{base_url}{endpoint}", request_body, params, headers, auth, timeout)
+
+    @staticmethod
+    def bind(base_url, auth_type=None, timeout=HTTP_TIMEOUT):
+        """
+        Prebind the base URL and resolved authentication for a burst of requests
+
+        Args:
+            base_url: Base URL of the API
+            auth_type: Authentication type ('basic', 'bearer', 'token', or None)
+            timeout: Seconds, or a (connect, read) tuple, before a request fails (default: HTTP_TIMEOUT)
+
+        Returns:
+            callable: send(method, endpoint, request_body=None, params=None) -> Response,
+                with the same method rules as execute_request
+
+        Raises:
+            ValueError: If credentials required by auth_type are missing
+        """
+        headers, auth = Utils.get_auth_headers(auth_type)
+
+        def send(method, endpoint, request_body=None, params=None):
+            return Utils._request(method, base_url + endpoint, request_body, params, headers, auth, timeout)
+
+        return send
+
+    @staticmethod
+    def _request(method, url, request_body, params, headers, auth, timeout):
+        """Send one request on the calling thread's session (backs execute_request and bind)"""
         method = method.upper()
 
-        if method == "GET":
-            return Utils.execute_get(base_url, endpoint, params, auth_type)
-        elif method == "POST":
-            return Utils.execute_post(base_url, endpoint, request_body, auth_type)
-        elif method == "PUT":
-            return Utils.execute_put(base_url, endpoint, request_body, auth_type)
-        elif method == "PATCH":
-            return Utils.execute_patch(base_url, endpoint, request_body, auth_type)
-        elif method == "DELETE":
-            return Utils.execute_delete(base_url, endpoint, auth_type)
+        try:
+            sends_body, sends_params = _METHOD_TABLE[method]
+        except KeyError:
+            raise ValueError(f"Unsupported HTTP method: {method}") from None
+        if not sends_body:
+            request_body = None
+        if not sends_params:
+            params = None
+
+        return Utils.get_session().request(
+            method, url, params=params, json=request_body, headers=headers, auth=auth, timeout=timeout
+        )
+
+    @staticmethod
+    def ensure_dir(path):
+        """
+        Create a directory (and parents) unless this process already has
+
+        Args:
+            path: Directory path
+        """
+        if path not in _ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            _ensured_dirs.add(path)
+
+    @staticmethod
+    def save_reports(test_results, test_type, testcases_dir="testcases"):
+        """
+        Save test results as both JSON and HTML reports, serializing the results once
+
+        The results array is serialized a single time; the JSON report is written indented
+        around it (byte-for-byte what save_json_report writes on its own) and the HTML
+        dashboard embeds the same text.
+
+        Args:
+            test_results: Dictionary containing test results
+            test_type: Type of test (integration, system, component, regression, sanity)
+            testcases_dir: Base testcases directory
+
+        Returns:
+            tuple: (JSON report path, HTML report path)
+        """
+        # Serialized JSON strings never contain raw newlines, so nesting the array one
+        # level deeper only means indenting each of its lines by two more spaces
+        results_json = Utils.to_json_bytes(test_results.get('results', []), indent=True).replace(b'\n', b'\n  ')
+
+        # Splice the results into the serialized remaining fields, keeping results last
+        header = {key: value for key, value in test_results.items() if key != 'results'}
+        if header:
+            payload = Utils.to_json_bytes(header, indent=True)[:-2] + b',\n  "results": ' + results_json + b'\n}'
         else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+            payload = b'{\n  "results": ' + results_json + b'\n}'
+
+        json_path = Utils.save_json_report(test_results, test_type, testcases_dir, payload=payload)
+        html_path = Utils.save_html_report(
+            test_results, test_type, testcases_dir, results_json=results_json.decode('utf-8')
+        )
+        return json_path, html_path
 
     @staticmethod
-    def save_json_report(test_results, test_type, testcases_dir="testcases"):
+    def save_json_report(test_results, test_type, testcases_dir="testcases", payload=None):
         """
         Save test results as JSON in the appropriate test type's reports directory
 
@@ -381,6 +717,7 @@ class Utils:
             test_results: Dictionary containing test results
             test_type: Type of test (integration, system, component, regression, sanity)
             testcases_dir: Base testcases directory
+            payload: test_results already serialized to JSON bytes (default: serialize here, indented)
 
         Returns:
             str: Path to the saved JSON report
@@ -389,21 +726,29 @@ class Utils:
 
         # Create reports directory if it doesn't exist
         reports_dir = os.path.join(testcases_dir, test_type, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
+        Utils.ensure_dir(reports_dir)
 
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"test_results_{timestamp}.json"
         filepath = os.path.join(reports_dir, filename)
 
-        # Save JSON report
-        with open(filepath, 'w') as f:
-            json.dump(test_results, f, indent=2)
+        # Save JSON report (serialized to bytes in one call, written in one write)
+        if payload is None:
+            payload = Utils.to_json_bytes(test_results, indent=True)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+
+        Utils._append_history(reports_dir, {
+            'timestamp': test_results.get('timestamp', ''),
+            'summary': test_results.get('summary', {}),
+            'filename': filename
+        })
 
         return filepath
 
     @staticmethod
-    def save_html_report(test_results, test_type, testcases_dir="testcases"):
+    def save_html_report(test_results, test_type, testcases_dir="testcases", results_json=None):
         """
         Save test results as interactive HTML dashboard in the appropriate test type's reports directory
 
@@ -411,6 +756,7 @@ class Utils:
             test_results: Dictionary containing test results
             test_type: Type of test (integration, system, component, regression, sanity)
             testcases_dir: Base testcases directory
+            results_json: The results array already serialized to JSON text (default: serialize here)
 
         Returns:
             str: Path to the saved HTML report
@@ -419,37 +765,39 @@ class Utils:
 
         # Create reports directory if it doesn't exist
         reports_dir = os.path.join(testcases_dir, test_type, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
+        Utils.ensure_dir(reports_dir)
 
         # Extract data
         summary = test_results.get('summary', {})
         results = test_results.get('results', [])
         timestamp = test_results.get('timestamp', '')
 
-        # Group results by endpoint
-        endpoints = {}
+        # Group results by endpoint (one dict lookup per result; counts derived per group)
+        grouped = {}
         for result in results:
-            endpoint_key = f"{result['method']} {result['endpoint']}"
-            if endpoint_key not in endpoints:
-                endpoints[endpoint_key] = {
-                    'method': result['method'],
-                    'endpoint': result['endpoint'],
-                    'tests': [],
-                    'passed': 0,
-                    'failed': 0
-                }
-            endpoints[endpoint_key]['tests'].append(result)
-            if result['passed']:
-                endpoints[endpoint_key]['passed'] += 1
-            else:
-                endpoints[endpoint_key]['failed'] += 1
+            key = (result['method'], result['endpoint'])
+            tests = grouped.get(key)
+            if tests is None:
+                tests = grouped[key] = []
+            tests.append(result)
+
+        endpoints = {}
+        for (method, endpoint), tests in grouped.items():
+            passed = sum(1 for test in tests if test['passed'])
+            endpoints[f"{method} {endpoint}"] = {
+                'method': method,
+                'endpoint': endpoint,
+                'tests': tests,
+                'passed': passed,
+                'failed': len(tests) - passed
+            }
 
         # Load historical data
         history_data = Utils.load_test_history(test_type, testcases_dir)
 
         # Generate HTML content
         html_content = Utils._generate_html_dashboard(
-            summary, results, endpoints, timestamp, test_type, history_data
+            summary, results, endpoints, timestamp, test_type, history_data, results_json
         )
 
         # Generate filename with timestamp
@@ -457,9 +805,9 @@ class Utils:
         filename = f"test_report_{timestamp_str}.html"
         filepath = os.path.join(reports_dir, filename)
 
-        # Save HTML report
-        with open(filepath, 'w') as f:
-            f.write(html_content)
+        # Save HTML report, encoded once and written in one call (embedded JSON data is UTF-8)
+        with open(filepath, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
 
         return filepath
 
@@ -481,30 +829,132 @@ class Utils:
         if not os.path.exists(reports_dir):
             return []
 
-        # Get all JSON report files
-        json_files = sorted(
-            [f for f in os.listdir(reports_dir) if f.startswith('test_results_') and f.endswith('.json')],
-            reverse=True
-        )[:limit]
+        history = Utils._read_history_index(reports_dir)
+        if history is None:
+            # No index yet (reports written before it existed): scan the report files
+            return Utils._scan_test_history(reports_dir, limit)
+        return history[::-1][:limit]
+
+    @staticmethod
+    def _read_history_index(reports_dir):
+        """Read a reports directory's history index (None if missing or unreadable)"""
+        try:
+            with open(os.path.join(reports_dir, HISTORY_INDEX_FILENAME), 'rb') as f:
+                return Utils.from_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _append_history(reports_dir, record):
+        """
+        Add a saved report's record to the history index, keeping the newest HISTORY_INDEX_MAX
+
+        Args:
+            reports_dir: Reports directory of the test type
+            record: {timestamp, summary, filename} of the report just written
+        """
+        history = Utils._read_history_index(reports_dir)
+        if history is None:
+            # Bootstrap from the report files, which already include the new report
+            history = Utils._scan_test_history(reports_dir, HISTORY_INDEX_MAX)[::-1]
+        else:
+            history.append(record)
 
-        history = []
-        for json_file in json_files:
+        index_path = os.path.join(reports_dir, HISTORY_INDEX_FILENAME)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(Utils.to_json_bytes(history[-HISTORY_INDEX_MAX:]))
+        os.replace(tmp_path, index_path)
+
+    @staticmethod
+    def _scan_test_history(reports_dir, limit):
+        """Load history records by parsing the newest report files, newest first"""
+        # Newest JSON report files (timestamped names sort chronologically); only limit entries are kept
+        with os.scandir(reports_dir) as entries:
+            newest = heapq.nlargest(limit, (
+                e for e in entries
+                if e.name.startswith('test_results_') and e.name.endswith('.json') and e.is_file()
+            ), key=lambda e: e.name)
+
+        def read_one(entry):
             try:
-                with open(os.path.join(reports_dir, json_file), 'r') as f:
-                    data = json.load(f)
-                    history.append({
-                        'timestamp': data.get('timestamp', ''),
-                        'summary': data.get('summary', {}),
-                        'filename': json_file
-                    })
+                data = Utils._read_report_header(entry.path)
             except Exception as e:
-                print(f"Warning: Could not load {json_file}: {e}")
-                continue
+                print(f"Warning: Could not load {entry.name}: {e}")
+                return None
+            return {
+                'timestamp': data.get('timestamp', ''),
+                'summary': data.get('summary', {}),
+                'filename': entry.name
+            }
+
+        # Read the reports concurrently so cold-cache reads overlap; map() keeps newest-first order
+        if len(newest) <= 1:
+            records = [read_one(entry) for entry in newest]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(newest))) as pool:
+                records = list(pool.map(read_one, newest))
 
-        return history
+        return [record for record in records if record is not None]
 
     @staticmethod
-    def _generate_html_dashboard(summary, results, endpoints, timestamp, test_type, history_data):
+    def _read_report_header(path, keys=('timestamp', 'summary')):
+        """
+        Read selected top-level fields of a JSON report without parsing its results
+
+        Walks the top-level object of the report's first REPORT_HEAD_BYTES one member at a
+        time and stops once all keys are found, so the (large) results array that follows
+        them is never parsed. Falls back to parsing the whole file if a field isn't found there.
+
+        Args:
+            path: Path to the JSON report
+            keys: Top-level keys to read
+
+        Returns:
+            dict: The keys found in the report
+        """
+        with open(path, 'rb') as f:
+            head = f.read(REPORT_HEAD_BYTES)
+            # A multi-byte character cut at the end only affects members past the header
+            text = head.decode('utf-8', errors='ignore')
+
+            found = {}
+            complete = False
+            try:
+                pos = _JSON_WS_RE.match(text).end()
+                if text[pos] == '{':
+                    pos += 1
+                    while True:
+                        pos = _JSON_WS_RE.match(text, pos).end()
+                        if text[pos] == '}':
+                            complete = True
+                            break
+                        key, pos = _JSON_DECODER.raw_decode(text, pos)
+                        pos = _JSON_WS_RE.match(text, pos).end()
+                        if text[pos] != ':':
+                            break
+                        value, pos = _JSON_DECODER.raw_decode(text, _JSON_WS_RE.match(text, pos + 1).end())
+                        if key in keys:
+                            found[key] = value
+                            if len(found) == len(keys):
+                                complete = True
+                                break
+                        pos = _JSON_WS_RE.match(text, pos).end()
+                        if text[pos] != ',':
+                            break
+                        pos += 1
+            except (ValueError, IndexError):
+                # Truncated or unexpected layout: handled by the full parse below
+                pass
+
+            if complete:
+                return found
+
+            data = Utils.from_json(head + f.read())
+        return {key: data[key] for key in keys if key in data}
+
+    @staticmethod
+    def _generate_html_dashboard(summary, results, endpoints, timestamp, test_type, history_data, results_json=None):
         """
         Generate HTML dashboard content
 
@@ -515,16 +965,15 @@ class Utils:
             timestamp: Timestamp of test run
             test_type: Type of test
             history_data: Historical test data
+            results_json: results already serialized to JSON text (default: serialize here)
 
         Returns:
             str: HTML content
         """
         from datetime import datetime as dt
 
-        # Load HTML template
-        template_path = os.path.join(os.path.dirname(__file__), 'templates', 'test_report.html')
-        with open(template_path, 'r') as f:
-            template = f.read()
+        # Load HTML template (read and split into parts once per process)
+        template = _load_template(REPORT_TEMPLATE_PATH)
 
         # Prepare historical data for charts
         history_labels = []
@@ -551,28 +1000,23 @@ class Utils:
         else:
             formatted_timestamp = 'N/A'
 
-        # Replace template variables
-        html_content = template.replace('{{test_type}}', test_type.upper())
-        html_content = html_content.replace('{{formatted_timestamp}}', formatted_timestamp)
-        html_content = html_content.replace('{{total_tests}}', str(summary.get('total', 0)))
-        html_content = html_content.replace('{{passed_tests}}', str(summary.get('passed', 0)))
-        html_content = html_content.replace('{{failed_tests}}', str(summary.get('failed', 0)))
-        html_content = html_content.replace('{{pass_rate}}', summary.get('pass_rate', '0%'))
-
-        # Escape JSON for safe embedding in HTML <script> tags
-        # json.dumps already properly escapes strings for JSON, but we need to escape script tags
-        def escape_for_js(obj):
-            json_str = json.dumps(obj)
-            # Escape script tags to prevent them from breaking out of the script block
-            # The browser HTML parser will see </script> even inside JSON strings
-            json_str = json_str.replace('</script>', '<\\/script>')
-            json_str = json_str.replace('<script>', '<\\script>')
-            return json_str
-
-        html_content = html_content.replace('{{test_data}}', escape_for_js(results))
-        html_content = html_content.replace('{{endpoint_data}}', escape_for_js(list(endpoints.values())))
-        html_content = html_content.replace('{{history_labels}}', escape_for_js(history_labels))
-        html_content = html_content.replace('{{history_passed}}', escape_for_js(history_passed))
-        html_content = html_content.replace('{{history_failed}}', escape_for_js(history_failed))
-
-        return html_content
+        # Chart data repeats across reports rendered in the same process
+        labels_json, passed_json, failed_json = _history_blobs(
+            tuple(history_labels), tuple(history_passed), tuple(history_failed)
+        )
+
+        # Fill in all template variables
+        values = {
+            'test_type': test_type.upper(),
+            'formatted_timestamp': formatted_timestamp,
+            'total_tests': str(summary.get('total', 0)),
+            'passed_tests': str(summary.get('passed', 0)),
+            'failed_tests': str(summary.get('failed', 0)),
+            'pass_rate': summary.get('pass_rate', '0%'),
+            'test_data': _escape_script(results_json) if results_json is not None else _script_json(results),
+            'endpoint_data': _script_json(list(endpoints.values())),
+            'history_labels': labels_json,
+            'history_passed': passed_json,
+            'history_failed': failed_json
+        }
+        return _render_template(template, values)